@@ -12,6 +12,8 @@ import sys
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
@@ -45,6 +47,7 @@ class BaseScraper(ABC):
     Subclasses MAY override:
       - _setup_browser(): for stealth/Firefox
       - _get_accounts(): if portal has multi-account
+      - _wait_for_login_page(): readiness check before _login()
       - _after_login(): post-login navigation
     """
 
@@ -64,6 +67,7 @@ class BaseScraper(ABC):
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._http: Optional[requests.Session] = None
 
     # ─── Browser Setup ──────────────────────────────────────────────
 
@@ -105,12 +109,17 @@ class BaseScraper(ABC):
     # ─── Shared Helpers ─────────────────────────────────────────────
 
     def _find_field(self, selectors: list[str]):
-        """Find the first visible element matching any selector in the list."""
+        """
+        Find the first visible element matching any selector in the list.
+
+        Selectors are tried in list order. Visibility is filtered browser-side,
+        so each probe is one round trip; returns a Locator (or None).
+        """
         for selector in selectors:
             try:
-                el = self.page.query_selector(selector)
-                if el and el.is_visible():
-                    return el
+                locator = self.page.locator(selector).locator("visible=true").first
+                if locator.count():
+                    return locator
             except Exception:
                 continue
         return None
@@ -131,6 +140,23 @@ class BaseScraper(ABC):
             return True
         return False
 
+    def _first_visible(self, selectors: list[str], timeout: int = 15000):
+        """
+        Wait for any selector to match a visible element, then return the
+        first visible match in selector priority order.
+
+        The wait is a single auto-waiting locator over the CSS union; the
+        selectors are then probed in list order like _find_field, so an
+        earlier selector wins wherever its match sits in the page.
+        Returns None if nothing becomes visible within the timeout.
+        """
+        union = self.page.locator(", ".join(selectors)).locator("visible=true").first
+        try:
+            union.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeout:
+            return None
+        return self._find_field(selectors)
+
     def _wait_for_navigation(self, timeout: int = 15000):
         """Wait for page navigation. Catches timeout — never fatal."""
         try:
@@ -162,20 +188,59 @@ class BaseScraper(ABC):
 
     # ─── PDF Download Helpers ───────────────────────────────────────
 
+    def _get_http_session(self) -> requests.Session:
+        """Keep-alive session shared by every PDF download in this run."""
+        if self._http is None:
+            self._http = requests.Session()
+            self._http.mount("https://", HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ))
+        return self._http
+
+    def _sync_cookies_to_session(self, url: str):
+        """Copy the browser's current cookies for url into the HTTP session.
+
+        Done per download: scrapers keep navigating after login, and the
+        portal may set or rotate cookies along the way.
+        """
+        session = self._get_http_session()
+        for cookie in self.context.cookies(urls=[url]):
+            session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+            )
+
     def _download_pdf_from_url(self, url: str, filename: str) -> Optional[str]:
-        """Download a PDF from URL using requests with browser cookies."""
+        """Download a PDF from URL using requests with the logged-in session's cookies."""
         try:
-            cookies = self.context.cookies()
-            session = requests.Session()
-            for cookie in cookies:
-                session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""))
-
-            resp = session.get(url, timeout=30)
-            if resp.status_code == 200 and (resp.content[:4] == b"%PDF" or len(resp.content) > 1000):
-                filepath = str(self.download_dir / filename)
-                with open(filepath, "wb") as f:
-                    f.write(resp.content)
-                return filepath
+            self._sync_cookies_to_session(url)
+            session = self._get_http_session()
+
+            # Stream straight to disk rather than buffering the whole PDF in
+            # memory, via a .part file so a failed download never leaves a
+            # truncated PDF under the final name
+            filepath = self.download_dir / filename
+            part_path = filepath.with_name(filepath.name + ".part")
+            try:
+                with session.get(url, timeout=30, stream=True) as resp:
+                    if resp.status_code != 200:
+                        return None
+                    size = 0
+                    is_pdf = False
+                    with open(part_path, "wb") as f:
+                        for chunk in resp.iter_content(chunk_size=65536):
+                            if size == 0:
+                                is_pdf = chunk[:4] == b"%PDF"
+                            f.write(chunk)
+                            size += len(chunk)
+
+                if is_pdf or size > 1000:
+                    part_path.replace(filepath)
+                    return str(filepath)
+            finally:
+                part_path.unlink(missing_ok=True)
         except Exception as e:
             print(f"  PDF download failed: {e}")
         return None
@@ -234,6 +299,10 @@ class BaseScraper(ABC):
         """Get account list. Override for multi-account portals. Default: single implicit account."""
         return []
 
+    def _wait_for_login_page(self):
+        """Hook to wait for the login form to be usable. Default: fixed settle delay."""
+        self._wait_for_idle(3)
+
     def _after_login(self):
         """Hook for post-login navigation (e.g. dismiss popups). Override if needed."""
         pass
@@ -255,7 +324,7 @@ class BaseScraper(ABC):
                 # Login
                 print(f"Navigating to login page: {self.LOGIN_URL}")
                 self.page.goto(self.LOGIN_URL, wait_until="domcontentloaded")
-                self._wait_for_idle(3)
+                self._wait_for_login_page()
 
                 if not self._login():
                     result.errors.append("Login failed")
@@ -284,6 +353,9 @@ class BaseScraper(ABC):
                 self._save_screenshot("error.png")
 
             finally:
+                if self._http:
+                    self._http.close()
+                    self._http = None
                 if self.browser:
                     self.browser.close()
 
@@ -0,0 +1,19 @@
+"""
+Environment variable helpers for Python scrapers.
+"""
+
+import os
+from typing import Optional
+
+
+def first_env(*names: str) -> Optional[str]:
+    """
+    Return the value of the first set, non-empty environment variable.
+
+    Args:
+        names: Variable names in priority order
+
+    Returns:
+        The first non-empty value, or None if none are set
+    """
+    return next((value for value in map(os.getenv, names) if value), None)
@@ -20,7 +20,6 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from models import EnergyBillData, DocumentType, FetchResult
-from parser import parse_pdf
 
 
 def get_project_root() -> Path:
@@ -28,13 +27,15 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent.parent
 
 
+_ROOT = get_project_root()
+
+
 def load_env():
     """Load environment variables from .env files."""
-    root = get_project_root()
     loaded = False
     # Load in order - later files override earlier ones
     for env_file in [".env", ".env.local"]:
-        env_path = root / env_file
+        env_path = _ROOT / env_file
         if env_path.exists():
             load_dotenv(env_path, override=True)
             loaded = True
@@ -43,6 +44,8 @@ def load_env():
 
 def parse_existing_pdfs(pdf_dir: Path) -> list[EnergyBillData]:
     """Parse all Wake Electric PDFs in a directory."""
+    from parser import parse_pdf
+
     bills = []
 
     if not pdf_dir.exists():
@@ -82,7 +85,9 @@ def parse_existing_pdfs(pdf_dir: Path) -> list[EnergyBillData]:
 
 def test_parser():
     """Test the parser with sample files."""
-    sample_dir = get_project_root() / "data" / "sample-bills"
+    from parser import parse_pdf
+
+    sample_dir = _ROOT / "data" / "sample-bills"
 
     print("Testing parser with sample files...")
     print("="*60)
@@ -91,7 +96,7 @@ def test_parser():
     sample_files = list(sample_dir.glob("*wake*.pdf"))
     if not sample_files:
         # Try downloaded bills folder
-        download_dir = get_project_root() / "data" / "downloaded-bills" / "wake-electric"
+        download_dir = _ROOT / "data" / "downloaded-bills" / "wake-electric"
         sample_files = list(download_dir.glob("*.pdf"))
 
     if not sample_files:
@@ -121,7 +126,7 @@ def fetch_from_portal(headless: bool = True) -> FetchResult:
         print("Error: WAKE_ELECTRIC_USER and WAKE_ELECTRIC_PASS must be set")
         return FetchResult(success=False, errors=["Missing credentials"])
 
-    download_dir = get_project_root() / "data" / "downloaded-bills" / "wake-electric"
+    download_dir = _ROOT / "data" / "downloaded-bills" / "wake-electric"
 
     scraper = WakeElectricScraper(
         username=username,
@@ -192,15 +197,16 @@ def main():
 
     elif args.parse_only:
         # Parse existing PDFs
-        download_dir = get_project_root() / "data" / "downloaded-bills" / "wake-electric"
+        download_dir = _ROOT / "data" / "downloaded-bills" / "wake-electric"
         # Also check the main sample-bills folder
-        sample_dir = get_project_root() / "data" / "sample-bills"
+        sample_dir = _ROOT / "data" / "sample-bills"
 
         bills = []
         if download_dir.exists():
             bills.extend(parse_existing_pdfs(download_dir))
         if sample_dir.exists():
             # Parse wake electric samples from sample-bills
+            from parser import parse_pdf
             for pdf in sample_dir.glob("*wake*.pdf"):
                 try:
                     bills.append(parse_pdf(str(pdf)))
@@ -3,10 +3,69 @@ import re
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional
-import pdfplumber
 
 from models import EnergyBillData, DocumentType
 
+# Try to use pyahocorasick if available, fall back to per-indicator substring scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Disconnect notice indicators - must be explicit, not just informational
+# Note: "if your bill shows a disconnect notice" is informational text, not an actual notice
+DISCONNECT_INDICATORS = (
+    "disconnection notice",  # As a header/title
+    "your service will be disconnected",
+    "amount past due",
+    "final notice before disconnect",
+    "scheduled for disconnection",
+)
+
+# Regular bill indicators
+BILL_INDICATORS = (
+    "current charges due by",
+    "energy used",
+    "facility charge",
+    "kwh usage history",
+    "meter reading",
+    "residential",
+    "billing period",
+)
+
+
+def _build_indicator_automaton():
+    """Build one automaton over both indicator sets so text is scanned in a single pass."""
+    automaton = ahocorasick.Automaton()
+    for ind in DISCONNECT_INDICATORS:
+        automaton.add_word(ind, ("disconnect", ind))
+    for ind in BILL_INDICATORS:
+        automaton.add_word(ind, ("bill", ind))
+    automaton.make_automaton()
+    return automaton
+
+
+_INDICATOR_AUTOMATON = _build_indicator_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _find_indicators(text_lower: str) -> tuple[set[str], set[str]]:
+    """Return the (disconnect, bill) indicators present in lowercased text."""
+    if _INDICATOR_AUTOMATON is None:
+        return (
+            {ind for ind in DISCONNECT_INDICATORS if ind in text_lower},
+            {ind for ind in BILL_INDICATORS if ind in text_lower},
+        )
+
+    disconnect, bill = set(), set()
+    for _, (bucket, ind) in _INDICATOR_AUTOMATON.iter(text_lower):
+        if bucket == "disconnect":
+            disconnect.add(ind)
+        else:
+            bill.add(ind)
+    return disconnect, bill
+
 
 def parse_date(date_str: str) -> Optional[date]:
     """Parse date from various formats."""
@@ -52,36 +111,16 @@ def detect_document_type(text: str) -> DocumentType:
     if 'bill type' in text_lower and 'normal' in text_lower:
         return DocumentType.BILL
 
-    # Disconnect notice indicators - must be explicit, not just informational
-    # Note: "if your bill shows a disconnect notice" is informational text, not an actual notice
-    disconnect_indicators = [
-        "disconnection notice",  # As a header/title
-        "your service will be disconnected",
-        "amount past due",
-        "final notice before disconnect",
-        "scheduled for disconnection",
-    ]
-
-    # Regular bill indicators
-    bill_indicators = [
-        "current charges due by",
-        "energy used",
-        "facility charge",
-        "kwh usage history",
-        "meter reading",
-        "residential",
-        "billing period",
-    ]
+    disconnect_found, bill_found = _find_indicators(text_lower)
 
     # Count indicators, but ignore informational text about disconnect notices
     disconnect_score = 0
-    for ind in disconnect_indicators:
-        if ind in text_lower:
-            # Make sure it's not in an informational context
-            if "if your bill shows" not in text_lower[:text_lower.find(ind)+50]:
-                disconnect_score += 1
+    for ind in disconnect_found:
+        # Make sure it's not in an informational context (bounded find, no slice copy)
+        if text_lower.find("if your bill shows", 0, text_lower.find(ind) + 50) == -1:
+            disconnect_score += 1
 
-    bill_score = sum(1 for ind in bill_indicators if ind in text_lower)
+    bill_score = len(bill_found)
 
     if disconnect_score >= 2:
         return DocumentType.DISCONNECT_NOTICE
@@ -371,6 +410,9 @@ def parse_pdf(pdf_path: str) -> EnergyBillData:
     if not path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
+    # Deferred so importing this module for its helpers doesn't pull in pdfminer
+    import pdfplumber
+
     # Extract text from PDF
     full_text = ""
     with pdfplumber.open(pdf_path) as pdf:
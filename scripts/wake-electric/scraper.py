@@ -13,7 +13,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from playwright.sync_api import Playwright
+from playwright.sync_api import Playwright, TimeoutError as PlaywrightTimeout
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.base_scraper import BaseScraper
@@ -21,6 +21,23 @@ from lib.models import AccountInfo
 
 from models import EnergyBillData, DocumentType
 
+# Requests the scraper never needs. Stylesheets stay allowed: Angular Material
+# relies on them for the visibility checks used when filling the login form.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_HOSTS = (
+    "google-analytics",
+    "googletagmanager",
+    "doubleclick",
+    "hotjar",
+    "facebook.net",
+)
+
+# Dashboard account rows: "<10-digit account> — <ADDRESS> [— <status>]"
+_ACCOUNT_ROW_RE = re.compile(r"(\d{10})\s*[—–-]\s*([A-Z\s\d]+?)(?:\s*[—–-]\s*\w+)?(?:\n|$)")
+
+# Unique 10-digit account numbers in the page text, found and deduplicated in the browser
+_ACCOUNT_NUMBERS_JS = r"() => Array.from(new Set(document.body.innerText.match(/\b\d{10}\b/g) || []))"
+
 
 class WakeElectricScraper(BaseScraper):
     """Scraper for Wake Electric SmartHub portal (uses internal JSON API)."""
@@ -34,27 +51,63 @@ class WakeElectricScraper(BaseScraper):
         self.username = username
         self.password = password
 
+    def _setup_browser(self, playwright: Playwright, headless: bool = True):
+        """Standard browser, with images/fonts/trackers blocked to speed up page loads."""
+        super()._setup_browser(playwright, headless)
+        self.context.route("**/*", self._filter_request)
+        # SmartHub either renders an element promptly or not at all; fail fast
+        # instead of Playwright's 30s default. Longer waits pass timeout= explicitly.
+        self.page.set_default_timeout(5000)
+        self.page.set_default_navigation_timeout(15000)
+
+    @staticmethod
+    def _filter_request(route):
+        """Abort requests for heavy assets and third-party trackers; let the SPA through."""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or any(h in request.url for h in BLOCKED_HOSTS):
+            route.abort()
+        else:
+            route.continue_()
+
+    def _wait_for_login_page(self):
+        """No settle delay: the login locators in _login() auto-wait for the form."""
+        pass
+
     def _login(self) -> bool:
         """Login to SmartHub Angular Material portal."""
-        # SmartHub uses Angular Material inputs
-        if not self._fill_field(["#mat-input-0", 'input[type="text"]'], self.username):
+        # SmartHub uses Angular Material inputs. The app renders the form after
+        # DOMContentLoaded, so each locator auto-waits rather than waiting for
+        # network idle (SmartHub keeps analytics/XHR polling open).
+        username_field = self._first_visible(["#mat-input-0", 'input[type="text"]'])
+        if not username_field:
             print("Could not find username field")
             return False
+        username_field.fill(self.username)
 
-        if not self._fill_field(["#mat-input-1", 'input[type="password"]'], self.password):
+        password_field = self._first_visible(["#mat-input-1", 'input[type="password"]'])
+        if not password_field:
             print("Could not find password field")
             return False
+        password_field.fill(self.password)
 
-        if not self._click_button([".nisc-primary-button", 'button:has-text("Sign In")']):
+        sign_in = self._first_visible([".nisc-primary-button", 'button:has-text("Sign In")'])
+        if not sign_in:
             print("Could not find Sign In button")
             return False
+        sign_in.click()
 
-        self._wait_for_idle(8)
-
-        page_text = self._get_page_text()[:500]
-        if "CUSTOMER OVERVIEW" in page_text or "Make A Payment" in page_text:
+        # Wait for the dashboard to render instead of sleeping a fixed 8s
+        try:
+            self.page.wait_for_function(
+                "() => /CUSTOMER OVERVIEW|Make A Payment/.test(document.body.innerText)",
+                timeout=30000,
+            )
             return True
+        except PlaywrightTimeout:
+            pass
 
+        # Dashboard never appeared - only now pull the page text to diagnose
+        page_text = self._get_page_text()[:500]
         if "Sign In" in page_text and "Password" in page_text:
             print("Still on login page")
             return False
@@ -64,7 +117,7 @@ class WakeElectricScraper(BaseScraper):
     def _get_accounts(self) -> list[AccountInfo]:
         """Extract account numbers from dashboard text."""
         text = self._get_page_text()
-        matches = re.findall(r"(\d{10})\s*[—–-]\s*([A-Z\s\d]+?)(?:\s*[—–-]\s*\w+)?(?:\n|$)", text)
+        matches = _ACCOUNT_ROW_RE.findall(text)
         accounts = []
         for acct_num, address in matches:
             accounts.append(AccountInfo(
@@ -80,9 +133,7 @@ class WakeElectricScraper(BaseScraper):
 
         if not accounts:
             # Fallback: look for account numbers in the page
-            text = self._get_page_text()
-            acct_nums = re.findall(r"\b(\d{10})\b", text)
-            for num in set(acct_nums):
+            for num in self.page.evaluate(_ACCOUNT_NUMBERS_JS):
                 accounts.append(AccountInfo(account_number=num))
 
         for account in accounts:
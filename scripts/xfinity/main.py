@@ -11,6 +11,8 @@ Usage:
 """
 import argparse
 import json
+import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -18,7 +20,13 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from models import FetchResult, InternetBillData, DocumentType, AccountInfo
-from parser import parse_pdf
+from parser import parse_many
+
+# XFINITY_<ID>_USER / XFINITY_<ID>_PASS, or XFINITY_USER / XFINITY_PASS (no ID)
+_XFINITY_CRED_RE = re.compile(r'^XFINITY_(?:([A-Z0-9_]+)_)?(USER|PASS)$')
+
+# Account IDs that, when configured, are used on their own (checked in this order)
+_PRIMARY_ACCOUNT_IDS = ("INTERENT", "INTERNET")  # note: INTERENT typo is the primary env var name
 
 
 def parse_local_pdfs(directory: Path) -> FetchResult:
@@ -29,21 +37,21 @@ def parse_local_pdfs(directory: Path) -> FetchResult:
         result.errors.append(f"Directory not found: {directory}")
         return result
 
-    pdf_files = list(directory.glob("*.pdf"))
+    pdf_files = sorted(p for p in directory.iterdir() if p.suffix.lower() == ".pdf")
     if not pdf_files:
         result.errors.append(f"No PDF files found in {directory}")
         return result
 
     print(f"Found {len(pdf_files)} PDF files to parse")
 
-    for pdf_path in pdf_files:
-        try:
-            print(f"Parsing: {pdf_path.name}")
-            bill_data = parse_pdf(str(pdf_path))
+    # Text extraction is CPU-bound and each file is independent, so fan out to processes
+    for pdf_path, bill_data, error in parse_many(pdf_files):
+        print(f"Parsing: {pdf_path.name}")
+        if error is None:
             result.bills.append(bill_data)
             result.downloaded_pdfs.append(str(pdf_path))
-        except Exception as e:
-            result.errors.append(f"Error parsing {pdf_path.name}: {e}")
+        else:
+            result.errors.append(f"Error parsing {pdf_path.name}: {error}")
 
     result.success = len(result.bills) > 0
     return result
@@ -61,47 +69,33 @@ def get_xfinity_accounts() -> list[tuple[str, str, str]]:
 
     Returns list of (account_id, username, password) tuples.
     """
-    import os
-    import re
-
+    # One pass over the environment, grouping credentials by account ID;
+    # the legacy XFINITY_USER/PASS pair is keyed None so it can't collide
+    # with a real XFINITY_DEFAULT_* account
+    users, passwords = {}, {}
+    for key, value in os.environ.items():
+        match = _XFINITY_CRED_RE.match(key)
+        if match and value:
+            creds = users if match.group(2) == "USER" else passwords
+            creds[match.group(1)] = value
+
+    complete = [aid for aid in users if aid in passwords]
+
+    for account_id in _PRIMARY_ACCOUNT_IDS:
+        if account_id in complete:
+            print(f"Found Xfinity account: {account_id}")
+            return [(account_id, users[account_id], passwords[account_id])]
+
+    # Pattern-based accounts (XFINITY_<ID>_USER)
     accounts = []
+    for account_id in complete:
+        if account_id is not None:
+            accounts.append((account_id, users[account_id], passwords[account_id]))
+            print(f"Found Xfinity account: {account_id}")
 
-    # Check for XFINITY_INTERENT_USER format first (note: typo in env var name)
-    username = os.environ.get("XFINITY_INTERENT_USER")
-    password = os.environ.get("XFINITY_INTERENT_PASS")
-    if username and password:
-        accounts.append(("INTERENT", username, password))
-        print(f"Found Xfinity account: INTERENT")
-        return accounts
-
-    # Check for XFINITY_INTERNET_USER format (correct spelling)
-    username = os.environ.get("XFINITY_INTERNET_USER")
-    password = os.environ.get("XFINITY_INTERNET_PASS")
-    if username and password:
-        accounts.append(("INTERNET", username, password))
-        print(f"Found Xfinity account: INTERNET")
-        return accounts
-
-    # Check for pattern-based accounts (XFINITY_<ID>_USER)
-    pattern = re.compile(r'^XFINITY_([A-Z0-9_]+)_USER$')
-
-    for key in os.environ:
-        match = pattern.match(key)
-        if match:
-            account_id = match.group(1)
-            username = os.environ.get(key)
-            password = os.environ.get(f'XFINITY_{account_id}_PASS')
-
-            if username and password:
-                accounts.append((account_id, username, password))
-                print(f"Found Xfinity account: {account_id}")
-
-    # Also check for legacy single-account format
-    if not accounts:
-        username = os.environ.get("XFINITY_USER")
-        password = os.environ.get("XFINITY_PASS")
-        if username and password:
-            accounts.append(("DEFAULT", username, password))
+    # Fall back to the legacy single-account format
+    if not accounts and None in complete:
+        accounts.append(("DEFAULT", users[None], passwords[None]))
 
     return accounts
 
@@ -114,6 +108,7 @@ def main():
     parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
     parser.add_argument("--output", "-o", type=str, help="Output JSON to file")
     parser.add_argument("--account", "-a", type=str, help="Only fetch specific account")
+    parser.add_argument("--sequential", action="store_true", help="Fetch accounts one at a time in a shared browser")
 
     args = parser.parse_args()
 
@@ -136,9 +131,6 @@ def main():
         result = parse_local_pdfs(download_dir)
     else:
         # Full fetch from portal
-        import os
-        from scraper import XfinityScraper
-
         accounts = get_xfinity_accounts()
 
         if not accounts:
@@ -157,22 +149,17 @@ def main():
 
         print(f"Found {len(accounts)} Xfinity account(s) to process")
 
+        # One Chromium for all accounts, with a fresh context per account; the
+        # accounts run concurrently on one event loop unless --sequential is given
+        from scraper import XfinityScraper
+        account_results = XfinityScraper.fetch_bills_multi(
+            accounts, str(download_dir), headless=not args.visible, concurrent=not args.sequential
+        )
+
         # Aggregate results from all accounts
         result = FetchResult(success=False)
 
-        for account_id, username, password in accounts:
-            print(f"\n{'='*60}")
-            print(f"Processing account: {account_id}")
-            print(f"{'='*60}")
-
-            scraper = XfinityScraper(
-                username=username,
-                password=password,
-                download_dir=str(download_dir),
-            )
-
-            account_result = scraper.fetch_bills(headless=not args.visible)
-
+        for account_id, account_result in account_results:
             # Merge results
             result.accounts.extend(account_result.accounts)
             result.bills.extend(account_result.bills)
@@ -194,14 +181,14 @@ def main():
     }
 
     if args.json or args.output:
-        output_json = json.dumps(output_data, indent=2)
-
+        # Stream the encoder output instead of building the whole document as a string
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(output_json)
+                json.dump(output_data, f, indent=2)
             print(f"Results saved to: {args.output}", file=sys.stderr)
         else:
-            print(output_json)
+            json.dump(output_data, sys.stdout, indent=2)
+            print()
     else:
         # Human readable output
         print("\n" + "="*60)
@@ -66,6 +66,31 @@ class InternetBillData:
         """Convert to JSON string."""
         return json.dumps(self.to_dict(), indent=2)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "InternetBillData":
+        """Rebuild from the output of to_dict() (plus optional raw_text)."""
+        def _date(value):
+            return date.fromisoformat(value) if value else None
+
+        return cls(
+            document_type=DocumentType(data["document_type"]),
+            account_number=data["account_number"],
+            service_address=data["service_address"],
+            bill_date=_date(data.get("bill_date")),
+            due_date=_date(data.get("due_date")),
+            amount_due=data.get("amount_due", 0.0),
+            billing_period_start=_date(data.get("billing_period_start")),
+            billing_period_end=_date(data.get("billing_period_end")),
+            internet_charges=data.get("internet_charges", 0.0),
+            taxes_and_fees=data.get("taxes_and_fees", 0.0),
+            previous_balance=data.get("previous_balance", 0.0),
+            payments_received=data.get("payments_received", 0.0),
+            requires_attention=data.get("requires_attention", False),
+            attention_reason=data.get("attention_reason"),
+            pdf_path=data.get("pdf_path"),
+            raw_text=data.get("raw_text", ""),
+        )
+
 
 @dataclass
 class AccountInfo:
@@ -1,29 +1,229 @@
 """PDF parser for Xfinity utility bills."""
+import hashlib
+import importlib.util
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
-import pdfplumber
+from typing import Callable, Iterator, Optional, Union
 
 from models import InternetBillData, DocumentType
 
+# parse_many result per file: (path, bill, None) or (path, None, error)
+ParseOutcome = tuple[Union[str, Path], Optional[InternetBillData], Optional[str]]
+
+
+# Parsed results are cached by PDF content hash; bump the version whenever
+# extraction or parsing changes so stale entries are ignored.
+XFINITY_PARSER_CACHE_VERSION = 4
+_CACHE_DIR = Path('~/.cache/xfinity-parser').expanduser()
+
+# Deletes '$' and ',' in one C-level pass (float() ignores surrounding whitespace)
+_AMOUNT_STRIP = str.maketrans('', '', ',$')
+
+# Field patterns below are written in lowercase and run against text.lower(),
+# which is computed once per document. Only the address patterns, whose
+# captures are returned verbatim, search the original text.
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11,
+    'december': 12,
+}
+
+# Same shapes strptime accepts for the formats in parse_date, matched against
+# the lowercased string: "jan 05, 2026" / "feb 06", "01/05/26", "2026-01-05"
+_DAY = r'3[01]|[12]\d|0[1-9]|[1-9]'
+_MONTH_NUM = r'1[0-2]|0[1-9]|[1-9]'
+_DATE_RE = re.compile(
+    rf'(?P<mon>[a-z]+)\s+(?P<d>{_DAY})(?:,?\s+(?P<y>\d{{4}}))?'
+    rf'|(?P<m2>{_MONTH_NUM})/(?P<d2>{_DAY})/(?P<y2>\d{{4}}|\d{{2}})'
+    rf'|(?P<y3>\d{{4}})-(?P<m3>{_MONTH_NUM})-(?P<d3>{_DAY})'
+)
+
+_ACCOUNT_PATTERNS = tuple(re.compile(p) for p in (
+    # Account Number 8155 60 082 0617408 format
+    r'account\s*number\s*(\d{4}\s*\d{2}\s*\d{3}\s*\d{7})',
+    # Just the pattern itself (16 digits with spaces)
+    r'(\d{4}\s+\d{2}\s+\d{3}\s+\d{7})',
+    # Compact format (16 digits)
+    r'account\s*(?:number|#|:)?\s*(\d{16})',
+))
+
+_ADDRESS_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # "For" prefix pattern (most common in Xfinity bills)
+    r'For\s+(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR)[,\s]+[A-Z]+[,\s]+[A-Z]{2}[,\s]+\d{5}(?:-\d{4})?)',
+    # Alternative: look in mailing section
+    r'\n([A-Z][A-Z\s]+)\n(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR))\s*\n\s*([A-Z]+)[,\s]+([A-Z]{2})\s+(\d{5}(?:-\d{4})?)',
+))
+
+# Fallback: Look for address near name in mailing section (case-sensitive)
+# Pattern: NAME\n123 STREET NAME WAY\nCITY, ST 12345
+_MAILING_ADDRESS_RE = re.compile(
+    r'([A-Z][A-Z\s]+)\n(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR))\s*\n([A-Z]+),?\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)'
+)
+
+# Xfinity header row: account number, bill date and billing period in one line
+_DATE_GROUP = r'([a-z]+\s+\d{1,2},?\s+\d{4})'
+_HEADER_RE = re.compile(
+    r'(\d{4}\s+\d{2}\s+\d{3}\s+\d{7})\s+' + _DATE_GROUP + r'\s+'
+    + _DATE_GROUP + r'\s+to\s+' + _DATE_GROUP + r'\s+\d+\s+of\s+\d+'
+)
+
+# Field patterns are (anchor, pattern) pairs for _scan. The anchor is a
+# literal every match starts with; None marks patterns that must search the
+# whole text (no literal prefix, or an unbounded span like [^$]*).
+
+# Without a header row, each label is searched in priority order, so a
+# preferred label later in the text still beats an earlier fallback one.
+# Xfinity format: "8155 60 082 0617408 Jan 05, 2026 Jan 10, 2026 to Feb 09, 2026 1 of 3"
+_BILL_DATE_PATTERNS = tuple((anchor, re.compile(p + _DATE_GROUP)) for anchor, p in (
+    (None, r'\d{4}\s+\d{2}\s+\d{3}\s+\d{7}\s+'),  # header row: account number, then billing date
+    ('billing', r'billing\s+date\s*\n?\s*'),
+    ('bill', r'bill\s+date\s*:?\s*'),
+    ('statement', r'statement\s+date\s*:?\s*'),
+))
+
+_DUE_DATE_PATTERNS = tuple((anchor, re.compile(p)) for anchor, p in (
+    (None, r'(?:automatic\s+)?payment\s+(?:on\s+)?([a-z]+\s+\d{1,2},?\s+\d{4})'),
+    ('due', r'due\s+(?:by\s+|date\s*:?\s*)([a-z]+\s+\d{1,2},?\s*\d{0,4})'),
+    ('please', r'please\s+pay\s+by\s+([a-z]+\s+\d{1,2},?\s+\d{4})'),
+))
+
+_AMOUNT_PATTERNS = tuple((anchor, re.compile(p)) for anchor, p in (
+    ('amount', r'amount\s+due\s*\$?([\d,]+\.?\d*)'),
+    ('please', r'please\s+pay\s*\$?([\d,]+\.?\d*)'),
+    ('new', r'new\s+charges\s*\$?([\d,]+\.?\d*)'),
+    ('total', r'total\s+amount\s+due\s*\$?([\d,]+\.?\d*)'),
+))
+
+# Start and end of the billing period, with the header row's form first
+_PERIOD_DATES = _DATE_GROUP + r'\s*(?:to|-)\s*' + _DATE_GROUP
+_BILLING_PERIOD_PATTERNS = tuple((anchor, re.compile(p)) for anchor, p in (
+    (None, _DATE_GROUP + r'\s+to\s+' + _DATE_GROUP + r'\s+\d+\s+of\s+\d+'),
+    ('services', r'services\s+from\s*\n?\s*' + _PERIOD_DATES),
+    ('service', r'service\s+(?:from|period)\s*:?\s*' + _PERIOD_DATES),
+    ('billing', r'billing\s+period\s*:?\s*' + _PERIOD_DATES),
+))
+
+_INTERNET_PATTERNS = tuple((anchor, re.compile(p)) for anchor, p in (
+    ('regular', r'regular\s+monthly\s+charges\s*\$?([\d,]+\.?\d*)'),
+    ('my', r'my\s+xfinity\s+plan\s*\$?([\d,]+\.?\d*)'),
+    (None, r'internet[^\$]*\$?([\d,]+\.?\d*)'),
+))
+
+_TAX_PATTERNS = tuple((anchor, re.compile(p)) for anchor, p in (
+    ('taxes', r'taxes,\s*fees\s*and\s*other\s*charges\s*\$?([\d,]+\.?\d*)'),
+    ('taxes', r'taxes\s*&?\s*(?:government\s*)?fees\s*\$?([\d,]+\.?\d*)'),
+    ('sales', r'sales\s+tax\s*\$?([\d,]+\.?\d*)'),
+))
+
+_PREVIOUS_BALANCE_RE = re.compile(r'previous\s+balance\s*\$?([\d,]+\.?\d*)')
+
+_PAYMENT_PATTERNS = tuple((anchor, re.compile(p)) for anchor, p in (
+    # Xfinity format: "EFT Payment - thank you Jan 02 -$71.32"
+    ('eft', r'eft\s+payment\s*-\s*thank\s+you\s+[a-z]+\s+\d+\s+(-?\$?[\d,]+\.?\d*)'),
+    (None, r'(?:eft\s+)?payment[^$\n]*-\$?([\d,]+\.?\d*)'),
+    (None, r'payments?\s+received[^-\d]*(-?\$?[\d,]+\.?\d*)'),
+))
+
+# Disconnect/delinquency indicators
+DISCONNECT_INDICATORS = (
+    "disconnect notice",
+    "service disconnection",
+    "final notice",
+    "past due",
+    "termination of service",
+    "service will be disconnected",
+    "collection agency",
+    "suspension notice",
+)
+
+# Regular bill indicators (Xfinity-specific)
+BILL_INDICATORS = (
+    "xfinity",
+    "comcast",
+    "amount due",
+    "billing date",
+    "services from",
+    "automatic payment",
+    "your bill at a glance",
+    "thank you for choosing xfinity",
+    "regular monthly charges",
+)
+
+
+def _indicator_regex(indicators) -> re.Pattern:
+    """Compile indicators into one alternation wrapped in a lookahead.
+
+    The zero-width lookahead lets finditer report indicators that overlap
+    (e.g. "xfinity" inside "thank you for choosing xfinity") in a single pass.
+    """
+    return re.compile("(?=(" + "|".join(map(re.escape, indicators)) + "))")
+
+
+_DISCONNECT_INDICATOR_RE = _indicator_regex(DISCONNECT_INDICATORS)
+_BILL_INDICATOR_RE = _indicator_regex(BILL_INDICATORS)
+
+_DISCONNECT_AMOUNT_RE = re.compile(r'amount\s+due[^\$]*\$?([\d,]+\.?\d*)')
+_DISCONNECT_DUE_RE = re.compile(r'(?:due|pay\s+by|disconnect)[^\d]*(\w+\s+\d+,?\s+\d{4})')
+
 
 def parse_date(date_str: str, ref_year: int = None) -> Optional[date]:
     """Parse date from various formats used by Xfinity.
 
     Args:
         date_str: Date string to parse
-        ref_year: Reference year for dates without year (e.g., "Feb 06")
+        ref_year: Reference year for dates without year (e.g., "Feb 06");
+            defaults to the current year, looked up only when needed
     """
     if not date_str:
         return None
 
     date_str = date_str.strip()
 
-    # If no year provided, use current year
-    if ref_year is None:
-        ref_year = datetime.now().year
+    # Fast path for the common Xfinity shape "Jan 05, 2026" / "Jan 05 2026"
+    parts = date_str.split()
+    if len(parts) == 3:
+        month_name, day, year = parts
+        if day.endswith(','):
+            day = day[:-1]
+        month = _MONTHS.get(month_name.lower())
+        if month and day.isascii() and day.isdecimal() and len(day) <= 2 and year.isdecimal() and len(year) == 4:
+            try:
+                return date(int(year), month, int(day))
+            except ValueError:
+                pass
+
+    match = _DATE_RE.fullmatch(date_str.lower())
+    if match:
+        try:
+            if match.group('mon'):
+                month = _MONTHS.get(match.group('mon'))
+                if month:
+                    year = match.group('y')
+                    if year:
+                        return date(int(year), month, int(match.group('d')))
+                    if ref_year is None:
+                        ref_year = datetime.now().year
+                    return date(ref_year, month, int(match.group('d')))
+            elif match.group('m2'):
+                year = int(match.group('y2'))
+                if len(match.group('y2')) == 2:
+                    # strptime's %y pivot: 69-99 -> 1900s, 00-68 -> 2000s
+                    year += 1900 if year >= 69 else 2000
+                return date(year, int(match.group('m2')), int(match.group('d2')))
+            else:
+                return date(int(match.group('y3')), int(match.group('m3')), int(match.group('d3')))
+        except ValueError:
+            pass
 
+    # Anything the fast path did not handle goes through strptime
     # Xfinity uses formats like "Jan 05, 2026", "Feb 09, 2026"
     formats = [
         "%b %d, %Y",     # Jan 05, 2026
@@ -42,6 +242,10 @@ def parse_date(date_str: str, ref_year: int = None) -> Optional[date]:
             continue
 
     # Try formats without year - append reference year
+    # If no year provided, use current year
+    if ref_year is None:
+        ref_year = datetime.now().year
+
     formats_no_year = [
         "%b %d",         # Jan 05 or Feb 09
         "%B %d",         # January 05
@@ -57,50 +261,44 @@ def parse_date(date_str: str, ref_year: int = None) -> Optional[date]:
     return None
 
 
+def _scan(text_lower: str, anchor: Optional[str], pat: re.Pattern, window: int = 96) -> Optional[re.Match]:
+    """Search for pat starting at the first occurrence of its anchor literal.
+
+    The pattern is tried in a short window after the anchor first and only
+    searches the rest of the text when nothing matches there or the match
+    runs into the window edge, so results are the same as pat.search().
+    """
+    if anchor is None:
+        return pat.search(text_lower)
+    start = text_lower.find(anchor)
+    if start < 0:
+        return None
+    end = start + window
+    match = pat.search(text_lower, start, end)
+    if match and match.end() < end:
+        return match
+    return pat.search(text_lower, start)
+
+
 def parse_amount(amount_str: str) -> float:
     """Parse dollar amount from string."""
     if not amount_str:
         return 0.0
-    # Remove $ and commas, handle negative
-    cleaned = re.sub(r'[,$]', '', amount_str.strip())
-    # Handle negative amounts like "-65.00"
+    # Remove $ and commas, handle negative amounts like "-65.00"
     try:
-        return float(cleaned)
+        return float(amount_str.translate(_AMOUNT_STRIP))
     except ValueError:
         return 0.0
 
 
-def detect_document_type(text: str) -> DocumentType:
+def detect_document_type(text: str, text_lower: Optional[str] = None) -> DocumentType:
     """Detect if document is a regular bill or disconnect notice."""
-    text_lower = text.lower()
-
-    # Disconnect/delinquency indicators
-    disconnect_indicators = [
-        "disconnect notice",
-        "service disconnection",
-        "final notice",
-        "past due",
-        "termination of service",
-        "service will be disconnected",
-        "collection agency",
-        "suspension notice",
-    ]
-
-    # Regular bill indicators (Xfinity-specific)
-    bill_indicators = [
-        "xfinity",
-        "comcast",
-        "amount due",
-        "billing date",
-        "services from",
-        "automatic payment",
-        "your bill at a glance",
-        "thank you for choosing xfinity",
-        "regular monthly charges",
-    ]
+    if text_lower is None:
+        text_lower = text.lower()
 
-    disconnect_score = sum(1 for ind in disconnect_indicators if ind in text_lower)
-    bill_score = sum(1 for ind in bill_indicators if ind in text_lower)
+    # Each indicator counts once, however often it appears
+    disconnect_score = len({m.group(1) for m in _DISCONNECT_INDICATOR_RE.finditer(text_lower)})
+    bill_score = len({m.group(1) for m in _BILL_INDICATOR_RE.finditer(text_lower)})
 
     if disconnect_score >= 2:
         return DocumentType.DISCONNECT_NOTICE
@@ -109,41 +307,42 @@ def detect_document_type(text: str) -> DocumentType:
     return DocumentType.UNKNOWN
 
 
-def extract_account_number(text: str) -> Optional[str]:
+def extract_account_number(text: str, text_lower: Optional[str] = None) -> Optional[str]:
     """Extract account number from text (Xfinity format: 8155 60 082 0617408)."""
-    patterns = [
-        # Account Number 8155 60 082 0617408 format
-        r'Account\s*Number\s*(\d{4}\s*\d{2}\s*\d{3}\s*\d{7})',
-        r'ACCOUNT\s*NUMBER\s*(\d{4}\s*\d{2}\s*\d{3}\s*\d{7})',
-        # Just the pattern itself (16 digits with spaces)
-        r'(\d{4}\s+\d{2}\s+\d{3}\s+\d{7})',
-        # Compact format (16 digits)
-        r'Account\s*(?:Number|#|:)?\s*(\d{16})',
-    ]
+    if text_lower is None:
+        text_lower = text.lower()
+    return _extract_account_cached(text_lower)
+
 
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+# Account and address extraction are memoized per document text so callers
+# that route the same text through several parse paths only scan it once.
+@lru_cache(maxsize=8)
+def _extract_account_cached(text_lower: str) -> Optional[str]:
+    for pat in _ACCOUNT_PATTERNS:
+        match = pat.search(text_lower)
         if match:
-            # Normalize to standard format with spaces
-            raw = match.group(1).replace(" ", "")
-            if len(raw) == 16:
-                return f"{raw[:4]} {raw[4:6]} {raw[6:9]} {raw[9:]}"
-            return match.group(1).strip()
+            return _normalize_account(match.group(1))
     return None
 
 
+def _normalize_account(number: str) -> str:
+    """Normalize to standard format with spaces: 8155 60 082 0617408."""
+    raw = number.replace(" ", "")
+    if len(raw) == 16:
+        return f"{raw[:4]} {raw[4:6]} {raw[6:9]} {raw[9:]}"
+    return number.strip()
+
+
 def extract_service_address(text: str) -> Optional[str]:
     """Extract service address from text."""
-    # Xfinity bill format: "For 3448 BERETANIA WAY, SACRAMENTO, CA, 95834-2548"
-    patterns = [
-        # "For" prefix pattern (most common in Xfinity bills)
-        r'For\s+(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR)[,\s]+[A-Z]+[,\s]+[A-Z]{2}[,\s]+\d{5}(?:-\d{4})?)',
-        # Alternative: look in mailing section
-        r'\n([A-Z][A-Z\s]+)\n(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR))\s*\n\s*([A-Z]+)[,\s]+([A-Z]{2})\s+(\d{5}(?:-\d{4})?)',
-    ]
+    return _extract_address_cached(text)
+
 
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+@lru_cache(maxsize=8)
+def _extract_address_cached(text: str) -> Optional[str]:
+    # Xfinity bill format: "For 3448 BERETANIA WAY, SACRAMENTO, CA, 95834-2548"
+    for pat in _ADDRESS_PATTERNS:
+        match = pat.search(text)
         if match:
             if match.lastindex >= 4:
                 # Multi-group pattern
@@ -151,47 +350,62 @@ def extract_service_address(text: str) -> Optional[str]:
             return match.group(1).strip()
 
     # Fallback: Look for address near name in mailing section
-    # Pattern: NAME\n123 STREET NAME WAY\nCITY, ST 12345
-    addr_pattern = r'([A-Z][A-Z\s]+)\n(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR))\s*\n([A-Z]+),?\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)'
-    match = re.search(addr_pattern, text)
+    match = _MAILING_ADDRESS_RE.search(text)
     if match:
         return f"{match.group(2).strip()}, {match.group(3).strip()}, {match.group(4).strip()} {match.group(5)}"
 
     return None
 
 
-def parse_regular_bill(text: str, pdf_path: str) -> InternetBillData:
-    """Parse a regular Xfinity bill PDF."""
-    account_number = extract_account_number(text) or "UNKNOWN"
+def parse_regular_bill(
+    text: str,
+    pdf_path: str,
+    text_lower: Optional[str] = None,
+    now_year: Optional[int] = None,
+    keep_raw_text: bool = False,
+) -> InternetBillData:
+    """Parse a regular Xfinity bill PDF.
+
+    now_year is the fallback year for dates printed without one; parse_pdf
+    looks it up once per document. Defaults to the current year.
+    keep_raw_text stores the first 500 characters of text in raw_text.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+
+    # The header row carries the account, bill date and billing period:
+    # "8155 60 082 0617408 Jan 05, 2026 Jan 10, 2026 to Feb 09, 2026 1 of 3"
+    account_number = bill_date = billing_start = billing_end = None
+    header = _HEADER_RE.search(text_lower)
+    if header:
+        bill_date = parse_date(header.group(2), now_year)
+        billing_start = parse_date(header.group(3), now_year)
+        billing_end = parse_date(header.group(4), now_year)
+        if bill_date and billing_start and billing_end:
+            account_number = _normalize_account(header.group(1))
+        else:
+            bill_date = billing_start = billing_end = None
+
+    account_number = account_number or extract_account_number(text, text_lower) or "UNKNOWN"
     service_address = extract_service_address(text) or "UNKNOWN"
 
     # Extract bill/billing date (format: "Jan 05, 2026")
-    # Xfinity format: "8155 60 082 0617408 Jan 05, 2026 Jan 10, 2026 to Feb 09, 2026 1 of 3"
-    bill_date = None
-    bill_date_patterns = [
-        # Header row format: account number followed by billing date
-        r'\d{4}\s+\d{2}\s+\d{3}\s+\d{7}\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        r'Billing\s+Date\s*\n?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        r'Bill\s+Date\s*:?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        r'Statement\s+Date\s*:?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-    ]
-    for pattern in bill_date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            bill_date = parse_date(match.group(1))
-            if bill_date:
-                break
+    if bill_date is None:
+        for anchor, pat in _BILL_DATE_PATTERNS:
+            match = _scan(text_lower, anchor, pat)
+            if match:
+                bill_date = parse_date(match.group(1), now_year)
+                if bill_date:
+                    break
 
     # Extract due date (for Xfinity this is usually the auto-pay date)
     due_date = None
-    ref_year = bill_date.year if bill_date else datetime.now().year
-    due_date_patterns = [
-        r'(?:Automatic\s+)?[Pp]ayment\s+(?:on\s+)?([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        r'Due\s+(?:by\s+|Date\s*:?\s*)([A-Za-z]+\s+\d{1,2},?\s*\d{0,4})',
-        r'Please\s+pay\s+by\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-    ]
-    for pattern in due_date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    if bill_date:
+        ref_year = bill_date.year
+    else:
+        ref_year = now_year if now_year is not None else datetime.now().year
+    for anchor, pat in _DUE_DATE_PATTERNS:
+        match = _scan(text_lower, anchor, pat)
         if match:
             date_str = match.group(1)
             due_date = parse_date(date_str, ref_year)
@@ -200,48 +414,27 @@ def parse_regular_bill(text: str, pdf_path: str) -> InternetBillData:
 
     # Extract amount due (format: "$71.32" or "Amount due $71.32")
     amount_due = 0.0
-    amount_patterns = [
-        r'Amount\s+due\s*\$?([\d,]+\.?\d*)',
-        r'Please\s+pay\s*\$?([\d,]+\.?\d*)',
-        r'New\s+charges\s*\$?([\d,]+\.?\d*)',
-        r'Total\s+Amount\s+Due\s*\$?([\d,]+\.?\d*)',
-    ]
-    for pattern in amount_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for anchor, pat in _AMOUNT_PATTERNS:
+        match = _scan(text_lower, anchor, pat)
         if match:
             amount_due = parse_amount(match.group(1))
             if amount_due > 0:
                 break
 
     # Extract billing period (format: "Jan 10, 2026 to Feb 09, 2026")
-    # Xfinity format in header: "Jan 10, 2026 to Feb 09, 2026 1 of 3"
-    billing_start = None
-    billing_end = None
-
-    billing_patterns = [
-        # Header row format after billing date
-        r'([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s+to\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s+\d+\s+of\s+\d+',
-        r'Services\s+From\s*\n?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s*(?:to|-)\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        r'Service\s+(?:from|period)\s*:?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s*(?:to|-)\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        r'Billing\s+Period\s*:?\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})\s*(?:to|-)\s*([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-    ]
-    for pattern in billing_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            billing_start = parse_date(match.group(1), ref_year)
-            billing_end = parse_date(match.group(2), ref_year)
-            if billing_start and billing_end:
-                break
+    if billing_start is None:
+        for anchor, pat in _BILLING_PERIOD_PATTERNS:
+            match = _scan(text_lower, anchor, pat)
+            if match:
+                billing_start = parse_date(match.group(1), ref_year)
+                billing_end = parse_date(match.group(2), ref_year)
+                if billing_start and billing_end:
+                    break
 
     # Extract internet/monthly charges
     internet_charges = 0.0
-    internet_patterns = [
-        r'Regular\s+monthly\s+charges\s*\$?([\d,]+\.?\d*)',
-        r'My\s+Xfinity\s+plan\s*\$?([\d,]+\.?\d*)',
-        r'Internet[^\$]*\$?([\d,]+\.?\d*)',
-    ]
-    for pattern in internet_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for anchor, pat in _INTERNET_PATTERNS:
+        match = _scan(text_lower, anchor, pat)
         if match:
             internet_charges = parse_amount(match.group(1))
             if internet_charges > 0:
@@ -253,13 +446,8 @@ def parse_regular_bill(text: str, pdf_path: str) -> InternetBillData:
 
     # Extract taxes and fees
     taxes_and_fees = 0.0
-    tax_patterns = [
-        r'Taxes,\s*fees\s*and\s*other\s*charges\s*\$?([\d,]+\.?\d*)',
-        r'Taxes\s*&?\s*(?:government\s*)?fees\s*\$?([\d,]+\.?\d*)',
-        r'Sales\s+Tax\s*\$?([\d,]+\.?\d*)',
-    ]
-    for pattern in tax_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for anchor, pat in _TAX_PATTERNS:
+        match = _scan(text_lower, anchor, pat)
         if match:
             taxes_and_fees = parse_amount(match.group(1))
             if taxes_and_fees > 0:
@@ -267,20 +455,14 @@ def parse_regular_bill(text: str, pdf_path: str) -> InternetBillData:
 
     # Extract previous balance
     previous_balance = 0.0
-    prev_match = re.search(r'Previous\s+balance\s*\$?([\d,]+\.?\d*)', text, re.IGNORECASE)
+    prev_match = _scan(text_lower, 'previous', _PREVIOUS_BALANCE_RE)
     if prev_match:
         previous_balance = parse_amount(prev_match.group(1))
 
     # Extract payments received (format: "EFT Payment - thank you Jan 02 -$71.32")
     payments_received = 0.0
-    payment_patterns = [
-        # Xfinity format: "EFT Payment - thank you Jan 02 -$71.32"
-        r'EFT\s+Payment\s*-\s*thank\s+you\s+[A-Za-z]+\s+\d+\s+(-?\$?[\d,]+\.?\d*)',
-        r'(?:EFT\s+)?Payment[^$\n]*-\$?([\d,]+\.?\d*)',
-        r'Payments?\s+Received[^-\d]*(-?\$?[\d,]+\.?\d*)',
-    ]
-    for pattern in payment_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for anchor, pat in _PAYMENT_PATTERNS:
+        match = _scan(text_lower, anchor, pat)
         if match:
             payments_received = abs(parse_amount(match.group(1)))
             if payments_received > 0:
@@ -301,26 +483,34 @@ def parse_regular_bill(text: str, pdf_path: str) -> InternetBillData:
         payments_received=payments_received,
         requires_attention=False,
         pdf_path=pdf_path,
-        raw_text=text[:500],
+        raw_text=text[:500] if keep_raw_text else "",
     )
 
 
-def parse_disconnect_notice(text: str, pdf_path: str) -> InternetBillData:
-    """Parse a disconnect notice PDF."""
-    account_number = extract_account_number(text) or "UNKNOWN"
+def parse_disconnect_notice(
+    text: str,
+    pdf_path: str,
+    text_lower: Optional[str] = None,
+    now_year: Optional[int] = None,
+    keep_raw_text: bool = False,
+) -> InternetBillData:
+    """Parse a disconnect notice PDF (options as in parse_regular_bill)."""
+    if text_lower is None:
+        text_lower = text.lower()
+    account_number = extract_account_number(text, text_lower) or "UNKNOWN"
     service_address = extract_service_address(text) or "UNKNOWN"
 
     # Extract amount due
     amount_due = 0.0
-    amount_match = re.search(r'Amount\s+Due[^\$]*\$?([\d,]+\.?\d*)', text, re.IGNORECASE)
+    amount_match = _DISCONNECT_AMOUNT_RE.search(text_lower)
     if amount_match:
         amount_due = parse_amount(amount_match.group(1))
 
     # Extract due date
     due_date = None
-    due_match = re.search(r'(?:Due|Pay\s+by|Disconnect)[^\d]*(\w+\s+\d+,?\s+\d{4})', text, re.IGNORECASE)
+    due_match = _DISCONNECT_DUE_RE.search(text_lower)
     if due_match:
-        due_date = parse_date(due_match.group(1))
+        due_date = parse_date(due_match.group(1), now_year)
 
     return InternetBillData(
         document_type=DocumentType.DISCONNECT_NOTICE,
@@ -331,16 +521,62 @@ def parse_disconnect_notice(text: str, pdf_path: str) -> InternetBillData:
         requires_attention=True,
         attention_reason="DISCONNECT NOTICE - Internet service disconnection pending",
         pdf_path=pdf_path,
-        raw_text=text[:500],
+        raw_text=text[:500] if keep_raw_text else "",
     )
 
 
-def parse_pdf(pdf_path: str) -> InternetBillData:
+def pdf_digest(pdf_path: str) -> str:
+    """Content hash that parse results are cached under."""
+    return hashlib.blake2b(Path(pdf_path).read_bytes(), digest_size=16).hexdigest()
+
+
+def _cache_file(path: Path, keep_raw_text: bool = False) -> Path:
+    """Cache location for a PDF, keyed by parser version and content hash."""
+    digest = pdf_digest(path)
+    suffix = "-raw" if keep_raw_text else ""
+    return _CACHE_DIR / f"v{XFINITY_PARSER_CACHE_VERSION}-{digest}{suffix}.json"
+
+
+def _load_cached(cache_file: Path, pdf_path: str) -> Optional[InternetBillData]:
+    """Return the cached result for a PDF, or None on a miss or unreadable entry."""
+    try:
+        with open(cache_file) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    try:
+        bill = InternetBillData.from_dict(data)
+    except (KeyError, TypeError, ValueError):
+        return None
+    # The same bytes may have been cached under another file name
+    bill.pdf_path = pdf_path
+    return bill
+
+
+def _store_cached(cache_file: Path, bill: InternetBillData) -> None:
+    """Write a parse result to the cache; failures only cost a future re-parse."""
+    data = bill.to_dict()
+    data["raw_text"] = bill.raw_text
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def parse_pdf(pdf_path: str, keep_raw_text: bool = False) -> InternetBillData:
     """
     Parse an Xfinity utility PDF and extract bill data.
 
+    Results are cached by content hash in ~/.cache/xfinity-parser, so
+    re-parsing an unchanged PDF skips text extraction entirely.
+
     Args:
         pdf_path: Path to the PDF file
+        keep_raw_text: Keep the first 500 characters of text in raw_text
 
     Returns:
         InternetBillData with extracted information
@@ -349,13 +585,71 @@ def parse_pdf(pdf_path: str) -> InternetBillData:
     if not path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    # Extract text from PDF
-    full_text = ""
+    cache_file = _cache_file(path, keep_raw_text)
+    bill = _load_cached(cache_file, pdf_path)
+    if bill is None:
+        bill = _parse_pdf_file(pdf_path, keep_raw_text)
+        _store_cached(cache_file, bill)
+    return bill
+
+
+def _iter_pages_pdfium(pdf_path: str) -> Iterator[str]:
+    """Yield page texts via PDFium (no layout analysis, much faster)."""
+    import pypdfium2 as pdfium
+
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+    except pdfium.PdfiumError:
+        yield from _iter_pages_pdfplumber(pdf_path)
+        return
+
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium separates lines with CRLF; the patterns expect LF
+            text = textpage.get_text_range().replace("\r\n", "\n")
+            textpage.close()
+            page.close()
+            yield text
+    finally:
+        pdf.close()
+
+
+def _iter_pages_pdfplumber(pdf_path: str) -> Iterator[str]:
+    """Yield page texts via pdfplumber."""
+    import pdfplumber
+
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
-            text = page.extract_text() or ""
-            full_text += text + "\n"
+            yield page.extract_text() or ""
+
+
+@lru_cache(maxsize=1)
+def _get_extractor() -> Callable[[str], Iterator[str]]:
+    """Pick the PDF text backend on first use.
+
+    The PDF libraries are imported lazily so callers that only need the
+    text helpers (parse_date, detect_document_type, ...) don't pay for them.
+    PDFium is preferred when pypdfium2 is installed; files it cannot open
+    fall back to pdfplumber.
+    """
+    if importlib.util.find_spec("pypdfium2") is None:
+        return _iter_pages_pdfplumber
+    return _iter_pages_pdfium
+
 
+def _iter_page_texts(pdf_path: str) -> Iterator[str]:
+    """Yield the text of each page in order, extracting lazily."""
+    return _get_extractor()(pdf_path)
+
+
+def _parse_text(
+    full_text: str,
+    pdf_path: str,
+    now_year: Optional[int] = None,
+    keep_raw_text: bool = False,
+) -> InternetBillData:
+    """Detect the document type of extracted text and parse it."""
     if not full_text.strip():
         return InternetBillData(
             document_type=DocumentType.UNKNOWN,
@@ -366,16 +660,19 @@ def parse_pdf(pdf_path: str) -> InternetBillData:
             pdf_path=pdf_path,
         )
 
+    # Lowercase once; every case-insensitive search runs against this copy
+    text_lower = full_text.lower()
+
     # Detect document type
-    doc_type = detect_document_type(full_text)
+    doc_type = detect_document_type(full_text, text_lower)
 
     if doc_type == DocumentType.DISCONNECT_NOTICE:
-        return parse_disconnect_notice(full_text, pdf_path)
+        return parse_disconnect_notice(full_text, pdf_path, text_lower, now_year, keep_raw_text)
     elif doc_type == DocumentType.BILL:
-        return parse_regular_bill(full_text, pdf_path)
+        return parse_regular_bill(full_text, pdf_path, text_lower, now_year, keep_raw_text)
     else:
         # Unknown type - try to extract basic info
-        account_number = extract_account_number(full_text) or "UNKNOWN"
+        account_number = extract_account_number(full_text, text_lower) or "UNKNOWN"
         service_address = extract_service_address(full_text) or "UNKNOWN"
 
         return InternetBillData(
@@ -385,20 +682,67 @@ def parse_pdf(pdf_path: str) -> InternetBillData:
             requires_attention=True,
             attention_reason="Unknown document type - manual review required",
             pdf_path=pdf_path,
-            raw_text=full_text[:500],
+            raw_text=full_text[:500] if keep_raw_text else "",
         )
 
 
+def _parse_pdf_file(pdf_path: str, keep_raw_text: bool = False) -> InternetBillData:
+    """Extract the text of every page and parse it (uncached).
+
+    The whole document is parsed at once: disconnect wording or itemized
+    charges on later pages change the document type and amounts.
+    """
+    # Each page is followed by a newline, as pdfplumber's per-page join did
+    full_text = "".join(f"{page_text}\n" for page_text in _iter_page_texts(pdf_path))
+    return _parse_text(full_text, pdf_path, datetime.now().year, keep_raw_text)
+
+
+def _parse_one(pdf_path: Union[str, Path], keep_raw_text: bool = False) -> ParseOutcome:
+    """Parse one PDF, returning (path, bill, None) or (path, None, error)."""
+    try:
+        return pdf_path, parse_pdf(str(pdf_path), keep_raw_text), None
+    except Exception as e:
+        # Return the message rather than the exception; not every exception pickles
+        return pdf_path, None, str(e)
+
+
+def parse_many(
+    pdf_paths: list[Union[str, Path]],
+    workers: Optional[int] = None,
+    keep_raw_text: bool = False,
+) -> list[ParseOutcome]:
+    """Parse several PDFs in parallel worker processes, preserving order.
+
+    A failing file does not stop the others: each entry is
+    (path, bill, None) on success or (path, None, error message).
+
+    Args:
+        pdf_paths: Paths to the PDF files
+        workers: Number of worker processes (default: CPU count)
+        keep_raw_text: Passed through to parse_pdf
+    """
+    parse = partial(_parse_one, keep_raw_text=keep_raw_text)
+    if len(pdf_paths) <= 1:
+        return [parse(p) for p in pdf_paths]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse, pdf_paths, chunksize=4))
+
+
 if __name__ == "__main__":
     # Test with sample files
+    import glob
     import sys
 
     if len(sys.argv) > 1:
-        pdf_path = sys.argv[1]
-        print(f"\n{'='*60}")
-        print(f"Parsing: {pdf_path}")
-        print('='*60)
-        result = parse_pdf(pdf_path)
-        print(result.to_json())
+        # Expand patterns ourselves so quoted globs work too
+        pdf_paths = []
+        for arg in sys.argv[1:]:
+            pdf_paths.extend(sorted(glob.glob(arg)) or [arg])
+
+        for pdf_path, result, error in parse_many(pdf_paths):
+            print(f"\n{'='*60}")
+            print(f"Parsing: {pdf_path}")
+            print('='*60)
+            print(result.to_json() if error is None else f"Error: {error}")
     else:
-        print("Usage: python parser.py <pdf_path>")
+        print("Usage: python parser.py <pdf_path|glob> [...]")
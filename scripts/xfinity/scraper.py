@@ -13,24 +13,235 @@ Login flow:
 6. Click Bill details
 7. Click Statement PDF to download
 """
+import asyncio
+import dataclasses
+import functools
+import multiprocessing
 import os
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import json
 import time
 
-from playwright.sync_api import sync_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
 from dotenv import load_dotenv
-import requests
 
 from models import AccountInfo, FetchResult, InternetBillData
-from parser import parse_pdf
+
+# Playwright, requests and the PDF parser are imported on first use, keeping
+# this module cheap to import for callers that never launch a browser
+if TYPE_CHECKING:
+    import requests
+    from playwright.async_api import Browser, Page
+
+# Try to use orjson if available, fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add parent directory to path for lib imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from lib.bill_storage import save_bill_pdf
+from lib.bill_storage import copy_bill_to_standard_location
+from lib.env import first_env
+
+# Account number as printed in the portal: 4-2-3-7 digit groups
+_ACCOUNT_RE = re.compile(r'(\d{4}\s+\d{2}\s+\d{3}\s+\d{7})')
+_ADDR_RE = re.compile(
+    r'(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR))\s*[,\s]+([A-Z]+)[,\s]+([A-Z]{2})\s+(\d{5})',
+    re.IGNORECASE,
+)
+
+# Page regions that carry the account summary; searched before falling back to the whole body
+_ACCOUNT_REGIONS = 'header, main, [data-testid*="account"]'
+
+# Saved login sessions hold live auth cookies, so they live in a private
+# per-user directory rather than next to the downloaded bills
+_SESSION_DIR = Path('~/.cache/xfinity-scraper').expanduser()
+
+# Requests the scraper never needs: page decoration and third-party analytics.
+# Stylesheets are kept, since visibility checks and hover menus depend on them.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_URL_PARTS = ("google-analytics", "doubleclick", "adobedtm", "quantummetric")
+
+
+async def _block_unneeded(route):
+    """Route handler that aborts blocked requests and lets everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(part in request.url for part in _BLOCKED_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _import_playwright():
+    """Import Playwright's async entry point."""
+    from playwright.async_api import async_playwright
+    return async_playwright
+
+
+@functools.lru_cache(maxsize=1)
+def _pw_timeout() -> type:
+    """Playwright's TimeoutError, imported on first use (for except clauses)."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeout
+    return PlaywrightTimeout
+
+
+def _dumps(payload: dict, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(payload, indent=2 if indent else None).encode()
+
+
+def _parse_worker(pdf_path: str, conn) -> None:
+    """Worker process body: parse one PDF and send back (True, bill) or (False, error)."""
+    from parser import parse_pdf
+
+    try:
+        conn.send((True, parse_pdf(pdf_path)))
+    except Exception as e:
+        conn.send((False, str(e)))
+    finally:
+        conn.close()
+
+
+async def _parse_in_worker(pdf_path: str, timeout: float) -> InternetBillData:
+    """
+    Parse a PDF in a separate process, killing it if it runs past timeout seconds.
+
+    PDFium is not thread-safe, so concurrent accounts must not parse in
+    threads of this process; and unlike a thread, a process stuck on a
+    malformed PDF can actually be stopped. Raises asyncio.TimeoutError on
+    timeout and RuntimeError when parsing fails.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_parse_worker, args=(pdf_path, send_conn), daemon=True)
+    proc.start()
+    send_conn.close()
+    try:
+        # recv blocks, so wait in a thread; killing the worker ends it with EOFError
+        ok, payload = await asyncio.wait_for(asyncio.to_thread(recv_conn.recv), timeout=timeout)
+    except EOFError:
+        await asyncio.to_thread(proc.join)
+        raise RuntimeError(f"parser process exited with code {proc.exitcode}") from None
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        await asyncio.to_thread(proc.join)
+        recv_conn.close()
+    if not ok:
+        raise RuntimeError(payload)
+    return payload
+
+
+# Bills parsed in this process, keyed by the parser's content hash. A
+# byte-identical statement seen again (a retry, or accounts sharing one)
+# skips the worker process as well as parsing.
+_PARSE_MEMO_SIZE = 64
+_parse_memo: dict[str, InternetBillData] = {}
+
+
+async def _parse_memoized(pdf_path: str, timeout: float) -> InternetBillData:
+    """_parse_in_worker, memoized by content hash for the process lifetime."""
+    from parser import pdf_digest
+
+    digest = await asyncio.to_thread(pdf_digest, pdf_path)
+    bill = _parse_memo.get(digest)
+    if bill is None:
+        bill = await _parse_in_worker(pdf_path, timeout)
+        if len(_parse_memo) >= _PARSE_MEMO_SIZE:
+            del _parse_memo[next(iter(_parse_memo))]
+        _parse_memo[digest] = bill
+    # The memoized bill is shared, so hand out a copy pointing at this file
+    return dataclasses.replace(bill, pdf_path=pdf_path)
+
+
+class _StageTimeout(Exception):
+    """A scraping stage ran past its time budget."""
+
+
+# Hides webdriver, and fakes plugins/languages, before any page script runs
+_STEALTH_INIT = (
+    "Object.defineProperty(navigator,'webdriver',{get:()=>undefined});"
+    "Object.defineProperty(navigator,'plugins',{get:()=>[1,2,3,4,5]});"
+    "Object.defineProperty(navigator,'languages',{get:()=>['en-US','en']});"
+)
+
+# Chromium flags that make the automated browser look less like one
+_CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-web-security",
+    "--disable-features=IsolateOrigins,site-per-process",
+]
+
+
+class XfinityBrowserPool:
+    """
+    One Chromium launch shared by any number of scrapers.
+
+    Use as ``async with XfinityBrowserPool(headless) as pool:`` and pass the
+    pool to XfinityScraper.fetch_bills_async; each scraper opens its own
+    context, so cookies and sessions stay isolated per account.
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self.browser: Optional["Browser"] = None
+        self._playwright = None
+
+    async def __aenter__(self) -> "XfinityBrowserPool":
+        try:
+            await self.launch()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def launch(self):
+        """Start Playwright and launch Chromium with stealth settings."""
+        # Use spectrum's playwright browser cache if available
+        project_root = Path(__file__).parent.parent.parent
+        browser_paths = [
+            project_root / "scripts" / "spectrum" / ".cache" / "ms-playwright",
+            project_root / "scripts" / "enbridge-gas" / ".cache" / "ms-playwright",
+            Path.home() / ".cache" / "ms-playwright",
+        ]
+
+        for bp in browser_paths:
+            if bp.exists():
+                os.environ["PLAYWRIGHT_BROWSERS_PATH"] = str(bp)
+                break
+
+        async_playwright = _import_playwright()
+        self._playwright = await async_playwright().start()
+        # Launch Chromium with stealth settings to avoid bot detection
+        self.browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=_CHROMIUM_ARGS,
+        )
+
+    async def new_context(self, **kwargs):
+        """Open a fresh (cookie-separated) context on the shared browser."""
+        return await self.browser.new_context(**kwargs)
+
+    async def close(self):
+        """Close the browser and stop Playwright."""
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
 
 class XfinityScraper:
@@ -39,14 +250,53 @@ class XfinityScraper:
     BASE_URL = "https://www.xfinity.com"
     LOGIN_URL = "https://login.xfinity.com/login"
 
-    def __init__(self, username: str, password: str, download_dir: str):
+    # Saved sessions older than this are ignored and a full login is done instead
+    SESSION_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+    # Upper bounds (seconds) per scraping stage, so one stuck page can't hang a batch
+    LOGIN_TIMEOUT = 90
+    NAVIGATION_TIMEOUT = 60
+    DOWNLOAD_TIMEOUT = 120
+    PARSE_TIMEOUT = 60
+
+    # Page text that only shows up once signed in
+    SUCCESS_INDICATORS = (
+        "thanks for being",
+        "gold member",
+        "member since",
+        "your account",
+        "my account",
+        "payments",
+        "billing",
+    )
+    # Text-engine selector, so the saved-session check runs in the page instead of copying out its HTML
+    _SUCCESS_TEXT = f"text=/{'|'.join(SUCCESS_INDICATORS)}/i"
+
+    # Messages the login page shows when the credentials are rejected
+    LOGIN_ERROR_INDICATORS = (
+        "incorrect password",
+        "invalid password",
+        "incorrect username",
+        "invalid username",
+        "authentication failed",
+        "login failed",
+    )
+
+    def __init__(self, username: str, password: str, download_dir: str, account_id: Optional[str] = None):
         self.username = username
         self.password = password
+        self.account_id = account_id
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.page: Optional["Page"] = None
         self.context = None
+        self._http: Optional["requests.Session"] = None
+        # Opt-in: reuse cookies/localStorage from the last successful login
+        self.reuse_session = os.getenv("XFINITY_REUSE_SESSION") == "1"
+        state_name = f"storage_state_{account_id.lower()}.json" if account_id else "storage_state.json"
+        self.storage_state_path = _SESSION_DIR / state_name
+        # Step-by-step screenshots are for debugging only; error screenshots are always taken
+        self.debug = bool(os.getenv("XFINITY_DEBUG"))
 
     def _copy_to_standard_location(self, pdf_path: str, service_address: str, billing_date: datetime = None) -> str:
         """Copy the PDF to the standardized bill storage location."""
@@ -58,14 +308,12 @@ class XfinityScraper:
             if not billing_date:
                 billing_date = datetime.now()
 
-            with open(pdf_path, 'rb') as f:
-                pdf_content = f.read()
-
-            standard_path = save_bill_pdf(
+            # Copy file-to-file rather than reading the whole PDF into memory
+            standard_path = copy_bill_to_standard_location(
+                source_path=pdf_path,
                 address=service_address,
                 provider="Xfinity",
                 billing_date=billing_date,
-                pdf_content=pdf_content
             )
             print(f"  Copied to standard location: {standard_path}")
             return standard_path
@@ -73,35 +321,46 @@ class XfinityScraper:
             print(f"  Warning: Could not copy to standard location: {e}")
             return pdf_path
 
-    def _setup_browser(self, playwright, headless: bool = True):
-        """Set up the browser with download handling."""
-        # Use spectrum's playwright browser cache if available
-        import os
-        project_root = Path(__file__).parent.parent.parent
-        browser_paths = [
-            project_root / "scripts" / "spectrum" / ".cache" / "ms-playwright",
-            project_root / "scripts" / "enbridge-gas" / ".cache" / "ms-playwright",
-            Path.home() / ".cache" / "ms-playwright",
-        ]
+    def _pdf_filename(self) -> str:
+        """Dated PDF filename, tagged with the account id so concurrent accounts don't collide."""
+        timestamp = datetime.now().strftime("%Y%m%d")
+        if self.account_id:
+            return f"xfinity_{self.account_id.lower()}_{timestamp}.pdf"
+        return f"xfinity_{timestamp}.pdf"
 
-        for bp in browser_paths:
-            if bp.exists():
-                os.environ["PLAYWRIGHT_BROWSERS_PATH"] = str(bp)
-                break
-
-        # Launch Chromium with stealth settings to avoid bot detection
-        self.browser = playwright.chromium.launch(
-            headless=headless,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-                "--disable-web-security",
-                "--disable-features=IsolateOrigins,site-per-process",
-            ]
-        )
+    def _saved_session(self) -> Optional[str]:
+        """Path of a recent saved session to start the context from, if reuse is enabled."""
+        if not self.reuse_session or not self.storage_state_path.exists():
+            return None
+        if time.time() - self.storage_state_path.stat().st_mtime > self.SESSION_MAX_AGE_SECONDS:
+            return None
+        return str(self.storage_state_path)
 
-        self.context = self.browser.new_context(
+    async def _save_session(self):
+        """Persist the authenticated cookies/localStorage for the next run."""
+        if not self.reuse_session:
+            return
+        tmp_path = self.storage_state_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            state = await self.context.storage_state()
+            _SESSION_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Created owner-only, and chmod'ed in case a leftover file was wider
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps(state))
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.storage_state_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            print(f"  Warning: Could not save session state: {e}")
+
+    async def _setup_browser(self, pool: XfinityBrowserPool):
+        """Open this account's context and page on the pool's browser, with download handling."""
+        storage_state = self._saved_session()
+        if storage_state:
+            print(f"Reusing saved session: {storage_state}")
+        self.context = await pool.new_context(
+            storage_state=storage_state,
             accept_downloads=True,
             viewport={"width": 1920, "height": 1080},
             user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -112,31 +371,134 @@ class XfinityScraper:
         )
 
         # Remove automation indicators
-        self.context.add_init_script("""
-            // Remove webdriver property
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            // Override plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            // Override languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-        """)
-        self.page = self.context.new_page()
-
-    def _login(self) -> bool:
+        await self.context.add_init_script(_STEALTH_INIT)
+        # Bound every wait, locator action and navigation that doesn't pass its own timeout
+        self.context.set_default_navigation_timeout(30000)
+        self.context.set_default_timeout(15000)
+        # Registered on the context so new tabs (e.g. a PDF viewer) are covered too
+        await self.context.route("**/*", _block_unneeded)
+        self.page = await self.context.new_page()
+
+    def _visible(self, selectors: list[str]):
+        """Locator for the visible elements matching any of the selectors, resolved in one browser call."""
+        return self.page.locator(", ".join(selectors)).locator("visible=true")
+
+    async def _first_visible(self, selectors: list[str], timeout: int = 5000):
+        """First visible element in selector priority order, or None if none shows up within timeout ms.
+
+        Waits once for any selector to match, then probes them in order, so an
+        earlier selector wins wherever its match sits in the document.
+        """
+        try:
+            await self._visible(selectors).first.wait_for(timeout=timeout)
+        except _pw_timeout():
+            return None
+        for selector in selectors:
+            elem = self.page.locator(selector).locator("visible=true").first
+            if await elem.is_visible():
+                return elem
+        return None
+
+    async def _click_first_visible(self, selectors: list[str], timeout: int = 5000) -> bool:
+        """Click the first visible match in selector priority order; False if none shows up within timeout ms."""
+        elem = await self._first_visible(selectors, timeout)
+        if elem is None:
+            return False
+        try:
+            await elem.click(timeout=timeout)
+            return True
+        except _pw_timeout():
+            return False
+
+    async def _get_http_session(self, url: str) -> "requests.Session":
+        """Keep-alive session for direct PDF downloads, carrying the browser's current cookies for url.
+
+        Cookies are copied on every call, since the portal may set or rotate
+        them between downloads.
+        """
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._http = requests.Session()
+            self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+        # Ask the browser only for the cookies that apply to this URL
+        for cookie in await self.context.cookies(urls=[url]):
+            self._http.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+            )
+        return self._http
+
+    @staticmethod
+    def _download_pdf_from_url(session: "requests.Session", url: str, save_path: Path) -> bool:
+        """Stream a PDF straight to disk; returns False (writing nothing) if the response isn't a PDF."""
+        with session.get(url, timeout=30, stream=True) as response:
+            if response.status_code != 200:
+                return False
+            chunks = response.iter_content(chunk_size=64 * 1024)
+            first = next(chunks, b"")
+            if first[:4] != b'%PDF':
+                return False
+            # Write to a .part file so an interrupted download never leaves a
+            # truncated PDF under the final name
+            part_path = save_path.with_name(save_path.name + '.part')
+            try:
+                with open(part_path, 'wb') as f:
+                    f.write(first)
+                    for chunk in chunks:
+                        f.write(chunk)
+                part_path.replace(save_path)
+            finally:
+                part_path.unlink(missing_ok=True)
+        return True
+
+    async def _debug_screenshot(self, name: str):
+        """Save a screenshot of the current page when XFINITY_DEBUG is set."""
+        if self.debug:
+            await self.page.screenshot(path=str(self.download_dir / name))
+
+    async def _has_text(self, selector: str) -> bool:
+        """Whether any element on the page matches a text selector."""
+        return await self.page.locator(selector).count() > 0
+
+    async def _wait_for_dom(self, timeout: int = 10000):
+        """Wait for the current navigation's DOM, carrying on regardless after timeout ms.
+
+        Readiness of the portal's client-rendered content is checked by
+        waiting for the specific element needed next, not for the network
+        to go quiet (analytics and polling keep it busy for seconds).
+        """
+        try:
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        except _pw_timeout():
+            pass
+
+    async def _has_session(self) -> bool:
+        """Check whether the context's saved session is still signed in."""
+        try:
+            await self.page.goto(self.BASE_URL, timeout=60000)
+            await self.page.wait_for_load_state("domcontentloaded")
+        except _pw_timeout():
+            return False
+
+        if "login" in self.page.url.lower():
+            return False
+        return await self._has_text(self._SUCCESS_TEXT)
+
+    async def _login(self) -> bool:
         """Log into the Xfinity portal."""
+        if self._saved_session() and await self._has_session():
+            print(f"Already logged in. Current URL: {self.page.url}")
+            return True
+
         print(f"Navigating to login page: {self.LOGIN_URL}")
 
-        # Navigate and wait for page to load
-        self.page.goto(self.LOGIN_URL, timeout=60000)
-        self.page.wait_for_timeout(5000)  # Wait for JS to initialize
+        # Navigate; the email step below waits for the form to render
+        await self.page.goto(self.LOGIN_URL, timeout=60000)
 
-        self.page.screenshot(path=str(self.download_dir / "01_login_page.png"))
+        await self._debug_screenshot("01_login_page.png")
 
         # Step 1: Enter email/username
         print("Entering email...")
@@ -148,26 +510,21 @@ class XfinityScraper:
             'input[autocomplete="username"]',
         ]
 
-        email_filled = False
-        for selector in email_selectors:
-            try:
-                elem = self.page.query_selector(selector)
-                if elem and elem.is_visible():
-                    elem.fill(self.username)
-                    email_filled = True
-                    print(f"  Filled email using selector: {selector}")
-                    break
-            except Exception:
-                continue
-
-        if not email_filled:
+        try:
+            elem = await self._first_visible(email_selectors, timeout=10000)
+            if elem is not None:
+                await elem.fill(self.username)
+        except _pw_timeout():
+            elem = None
+        if elem is None:
             print("Could not find email input")
-            self.page.screenshot(path=str(self.download_dir / "error_no_email_input.png"))
+            await self.page.screenshot(path=str(self.download_dir / "error_no_email_input.png"))
             return False
+        print("  Filled email")
 
         # Human-like delay after typing
-        self.page.wait_for_timeout(1500)
-        self.page.screenshot(path=str(self.download_dir / "02_email_entered.png"))
+        await asyncio.sleep(1.5)
+        await self._debug_screenshot("02_email_entered.png")
 
         # Step 2: Click "Let's go" button
         print("Clicking 'Let's go' button...")
@@ -180,36 +537,23 @@ class XfinityScraper:
             'button:has-text("Next")',
         ]
 
-        lets_go_clicked = False
-        for selector in lets_go_selectors:
-            try:
-                elem = self.page.query_selector(selector)
-                if elem and elem.is_visible():
-                    # Move mouse to element first, then click (more human-like)
-                    elem.scroll_into_view_if_needed()
-                    self.page.wait_for_timeout(500)
-                    elem.click()
-                    lets_go_clicked = True
-                    print(f"  Clicked Let's go using selector: {selector}")
-                    break
-            except Exception:
-                continue
-
-        if not lets_go_clicked:
+        # Brief pause before clicking (more human-like); the click scrolls the button into view
+        await asyncio.sleep(0.5)
+        if await self._click_first_visible(lets_go_selectors):
+            print("  Clicked Let's go")
+        else:
             print("Pressing Enter to submit email...")
-            self.page.keyboard.press('Enter')
+            await self.page.keyboard.press('Enter')
 
-        # Longer wait for password page to load
-        self.page.wait_for_timeout(5000)
-        self.page.screenshot(path=str(self.download_dir / "03_after_lets_go.png"))
+        await self._debug_screenshot("03_after_lets_go.png")
 
         # Step 3: Wait for password field and enter password
         print("Entering password...")
         try:
-            self.page.wait_for_selector('input[type="password"]', timeout=15000)
-        except PlaywrightTimeout:
+            await self.page.wait_for_selector('input[type="password"]', timeout=15000)
+        except _pw_timeout():
             print("Timeout waiting for password field")
-            self.page.screenshot(path=str(self.download_dir / "error_no_password_field.png"))
+            await self.page.screenshot(path=str(self.download_dir / "error_no_password_field.png"))
             return False
 
         password_selectors = [
@@ -219,25 +563,19 @@ class XfinityScraper:
             'input[autocomplete="current-password"]',
         ]
 
-        password_filled = False
-        for selector in password_selectors:
-            try:
-                elem = self.page.query_selector(selector)
-                if elem and elem.is_visible():
-                    elem.fill(self.password)
-                    password_filled = True
-                    print(f"  Filled password using selector: {selector}")
-                    break
-            except Exception:
-                continue
-
-        if not password_filled:
+        try:
+            elem = await self._first_visible(password_selectors)
+            if elem is not None:
+                await elem.fill(self.password)
+        except _pw_timeout():
+            elem = None
+        if elem is None:
             print("Could not find password input")
-            self.page.screenshot(path=str(self.download_dir / "error_no_password_input.png"))
+            await self.page.screenshot(path=str(self.download_dir / "error_no_password_input.png"))
             return False
+        print("  Filled password")
 
-        self.page.wait_for_timeout(500)
-        self.page.screenshot(path=str(self.download_dir / "04_password_entered.png"))
+        await self._debug_screenshot("04_password_entered.png")
 
         # Step 4: Click "Sign in" button
         print("Clicking 'Sign in' button...")
@@ -249,86 +587,57 @@ class XfinityScraper:
             'input[type="submit"]',
         ]
 
-        sign_in_clicked = False
-        for selector in sign_in_selectors:
-            try:
-                elem = self.page.query_selector(selector)
-                if elem and elem.is_visible():
-                    elem.click()
-                    sign_in_clicked = True
-                    print(f"  Clicked Sign in using selector: {selector}")
-                    break
-            except Exception:
-                continue
-
-        if not sign_in_clicked:
+        if await self._click_first_visible(sign_in_selectors):
+            print("  Clicked Sign in")
+        else:
             print("Pressing Enter to submit password...")
-            self.page.keyboard.press('Enter')
+            await self.page.keyboard.press('Enter')
 
-        # Wait for login to complete
+        # Wait for login to complete: the redirect off login.xfinity.com, then the page settling
         print("Waiting for login to complete...")
-        self.page.wait_for_timeout(8000)
-
         try:
-            self.page.wait_for_load_state("networkidle", timeout=20000)
-        except PlaywrightTimeout:
+            await self.page.wait_for_url(re.compile(r'xfinity\.com/(?!login)'), timeout=20000)
+        except _pw_timeout():
             pass
+        await self._wait_for_dom(timeout=20000)
 
-        self.page.screenshot(path=str(self.download_dir / "05_after_login.png"))
+        await self._debug_screenshot("05_after_login.png")
 
-        # Check if login was successful
+        # Check if login was successful: a signed-in session leaves the login host
         current_url = self.page.url
-        page_content = self.page.content()
-        page_content_lower = page_content.lower()
-
-        # Positive indicators of successful login
-        success_indicators = [
-            "thanks for being",
-            "gold member",
-            "member since",
-            "your account",
-            "my account",
-            "payments",
-            "billing",
-        ]
-
-        # Check for positive indicators first
-        if any(indicator in page_content_lower for indicator in success_indicators):
+        if "login.xfinity.com" not in current_url:
             print(f"Login successful. Current URL: {current_url}")
             return True
 
+        # Still on the login host; read just the start of the main content to see why
+        try:
+            page_text = (await self.page.locator('main').first.inner_text(timeout=5000))[:4096].lower()
+        except _pw_timeout():
+            page_text = ""
+
         # Check for explicit error messages on login page
-        if "login" in current_url.lower():
-            error_indicators = [
-                "incorrect password",
-                "invalid password",
-                "incorrect username",
-                "invalid username",
-                "authentication failed",
-                "login failed",
-            ]
-            if any(err in page_content_lower for err in error_indicators):
-                print("Login failed - invalid credentials")
-                self.page.screenshot(path=str(self.download_dir / "error_login_failed.png"))
-                return False
+        if any(err in page_text for err in self.LOGIN_ERROR_INDICATORS):
+            print("Login failed - invalid credentials")
+            await self.page.screenshot(path=str(self.download_dir / "error_login_failed.png"))
+            return False
 
-            # Check for verification requirements
-            if "verify" in page_content_lower or "verification" in page_content_lower:
-                print("Additional verification may be required")
-                self.page.screenshot(path=str(self.download_dir / "verification_required.png"))
-            elif "select your account" in page_content_lower:
-                print("Account selection page detected")
+        # Check for verification requirements
+        if "verify" in page_text or "verification" in page_text:
+            print("Additional verification may be required")
+            await self.page.screenshot(path=str(self.download_dir / "verification_required.png"))
+        elif "select your account" in page_text:
+            print("Account selection page detected")
 
         print(f"Login appears successful. Current URL: {current_url}")
         return True
 
-    def _navigate_to_billing(self) -> bool:
+    async def _navigate_to_billing(self) -> bool:
         """Navigate to the billing/statements page."""
         print("Navigating to billing...")
 
         # Wait for page to fully load
-        self.page.wait_for_timeout(3000)
-        self.page.screenshot(path=str(self.download_dir / "06_post_login.png"))
+        await self.page.wait_for_load_state("domcontentloaded")
+        await self._debug_screenshot("06_post_login.png")
 
         # Look for "Billing" or "Billing & Pay" in the navigation
         billing_selectors = [
@@ -340,59 +649,48 @@ class XfinityScraper:
             'span:has-text("Billing")',
         ]
 
-        for selector in billing_selectors:
-            try:
-                elems = self.page.query_selector_all(selector)
-                for elem in elems:
-                    if elem.is_visible():
-                        # Hover first for dropdown menus
-                        elem.hover()
-                        self.page.wait_for_timeout(1000)
-                        print(f"  Hovered on Billing using: {selector}")
-                        self.page.screenshot(path=str(self.download_dir / "07_billing_hover.png"))
-
-                        # Look for "View bill" or transaction history link
-                        view_bill_selectors = [
-                            'a:has-text("View bill and transaction history")',
-                            'a:has-text("View bill")',
-                            'a:has-text("transaction history")',
-                            'a[href*="bill"]',
-                        ]
-
-                        for vb_selector in view_bill_selectors:
-                            try:
-                                vb_elem = self.page.query_selector(vb_selector)
-                                if vb_elem and vb_elem.is_visible():
-                                    vb_elem.click()
-                                    print(f"  Clicked View bill using: {vb_selector}")
-                                    self.page.wait_for_timeout(3000)
-                                    self.page.screenshot(path=str(self.download_dir / "08_bill_history.png"))
-                                    return True
-                            except Exception:
-                                continue
-
-                        # If no dropdown item found, click on Billing directly
-                        elem.click()
-                        print(f"  Clicked Billing using: {selector}")
-                        self.page.wait_for_timeout(3000)
-                        break
-            except Exception:
-                continue
+        # Look for "View bill" or transaction history link
+        view_bill_selectors = [
+            'a:has-text("View bill and transaction history")',
+            'a:has-text("View bill")',
+            'a:has-text("transaction history")',
+            'a[href*="bill"]',
+        ]
+
+        try:
+            elem = await self._first_visible(billing_selectors)
+            if elem is not None:
+                # Hover first for dropdown menus; wait for the menu item, not a fixed delay
+                await elem.hover()
+                print("  Hovered on Billing")
+                await self._debug_screenshot("07_billing_hover.png")
+
+                if await self._click_first_visible(view_bill_selectors, timeout=2000):
+                    print("  Clicked View bill")
+                    await self._wait_for_dom()
+                    await self._debug_screenshot("08_bill_history.png")
+                    return True
+
+                # If no dropdown item found, click on Billing directly
+                await elem.click()
+                print("  Clicked Billing")
+                await self._wait_for_dom()
+        except _pw_timeout():
+            pass
 
-        self.page.screenshot(path=str(self.download_dir / "08_billing_page.png"))
+        await self._debug_screenshot("08_billing_page.png")
 
         # Try direct navigation to billing URL
         print("Trying direct navigation to billing URL...")
         try:
-            self.page.goto("https://www.xfinity.com/billing/details", timeout=30000)
-            self.page.wait_for_timeout(3000)
-        except PlaywrightTimeout:
+            await self.page.goto("https://www.xfinity.com/billing/details", timeout=30000, wait_until="domcontentloaded")
+        except _pw_timeout():
             pass
 
-        self.page.screenshot(path=str(self.download_dir / "09_billing_details.png"))
+        await self._debug_screenshot("09_billing_details.png")
         return True
 
-    def _download_statement_pdf(self) -> Optional[str]:
+    async def _download_statement_pdf(self) -> Optional[str]:
         """Download the statement PDF."""
         print("Looking for statement PDF download...")
 
@@ -404,18 +702,12 @@ class XfinityScraper:
             '[data-testid*="bill-details"]',
         ]
 
-        for selector in bill_details_selectors:
-            try:
-                elem = self.page.query_selector(selector)
-                if elem and elem.is_visible():
-                    elem.click()
-                    print(f"  Clicked Bill details using: {selector}")
-                    self.page.wait_for_timeout(3000)
-                    break
-            except Exception:
-                continue
+        # The billing page renders client-side; waiting for this link is the readiness check
+        if await self._click_first_visible(bill_details_selectors, timeout=10000):
+            print("  Clicked Bill details")
+            await self._wait_for_dom()
 
-        self.page.screenshot(path=str(self.download_dir / "10_bill_details.png"))
+        await self._debug_screenshot("10_bill_details.png")
 
         # Look for "Statement PDF" download link
         pdf_selectors = [
@@ -428,74 +720,81 @@ class XfinityScraper:
             '[aria-label*="download"]',
         ]
 
+        # Wait for any candidate to render, then try them in priority order;
+        # each selector is resolved afresh since a failed attempt can change the page
+        try:
+            await self._visible(pdf_selectors).first.wait_for(timeout=15000)
+        except _pw_timeout():
+            pass
+
         for selector in pdf_selectors:
+            elem = self.page.locator(selector).locator("visible=true").first
             try:
-                elem = self.page.query_selector(selector)
-                if elem and elem.is_visible():
-                    print(f"  Found PDF link using: {selector}")
-
-                    # Try to trigger download
-                    try:
-                        with self.page.expect_download(timeout=30000) as download_info:
-                            elem.click()
-                        download = download_info.value
-                        timestamp = datetime.now().strftime("%Y%m%d")
-                        filename = f"xfinity_{timestamp}.pdf"
-                        save_path = self.download_dir / filename
-                        download.save_as(str(save_path))
-                        print(f"Downloaded: {save_path}")
-                        return str(save_path)
-                    except PlaywrightTimeout:
-                        # Check if new tab opened with PDF
-                        pages = self.context.pages
-                        if len(pages) > 1:
-                            new_page = pages[-1]
-                            new_url = new_page.url
-                            print(f"New tab opened: {new_url}")
-
-                            if '.pdf' in new_url.lower() or 'blob:' in new_url.lower():
-                                # Download PDF via URL
-                                cookies = {c['name']: c['value'] for c in self.context.cookies()}
-                                try:
-                                    response = requests.get(new_url, cookies=cookies, timeout=30)
-                                    if response.status_code == 200 and response.content[:4] == b'%PDF':
-                                        timestamp = datetime.now().strftime("%Y%m%d")
-                                        filename = f"xfinity_{timestamp}.pdf"
-                                        save_path = self.download_dir / filename
-                                        with open(save_path, 'wb') as f:
-                                            f.write(response.content)
-                                        print(f"Downloaded from URL: {save_path}")
-                                        new_page.close()
-                                        return str(save_path)
-                                except Exception as e:
-                                    print(f"Error downloading from URL: {e}")
-
-                            new_page.close()
-                        else:
-                            # Maybe it opened in same page or triggered download
-                            elem.click()
-                            self.page.wait_for_timeout(5000)
+                if not await elem.is_visible():
+                    continue
+                print(f"  Found PDF link using: {selector}")
+
+                # Try to trigger download
+                try:
+                    async with self.page.expect_download(timeout=30000) as download_info:
+                        await elem.click()
+                    download = await download_info.value
+                    save_path = self.download_dir / self._pdf_filename()
+                    await download.save_as(str(save_path))
+                    print(f"Downloaded: {save_path}")
+                    return str(save_path)
+                except _pw_timeout():
+                    # Check if new tab opened with PDF
+                    pages = self.context.pages
+                    if len(pages) > 1:
+                        new_page = pages[-1]
+                        new_url = new_page.url
+                        print(f"New tab opened: {new_url}")
+
+                        if '.pdf' in new_url.lower() or 'blob:' in new_url.lower():
+                            # Download PDF via URL
+                            try:
+                                session = await self._get_http_session(new_url)
+                                save_path = self.download_dir / self._pdf_filename()
+                                # requests blocks, so keep it off the event loop shared with other accounts
+                                if await asyncio.to_thread(self._download_pdf_from_url, session, new_url, save_path):
+                                    print(f"Downloaded from URL: {save_path}")
+                                    await new_page.close()
+                                    return str(save_path)
+                            except Exception as e:
+                                print(f"Error downloading from URL: {e}")
+
+                        await new_page.close()
+                    else:
+                        # Maybe it opened in same page or triggered download
+                        await elem.click()
+                        await self._wait_for_dom()
 
             except Exception as e:
                 print(f"Error with selector {selector}: {e}")
                 continue
 
         print("Could not find or download PDF")
-        self.page.screenshot(path=str(self.download_dir / "error_no_pdf_found.png"))
+        await self.page.screenshot(path=str(self.download_dir / "error_no_pdf_found.png"))
         return None
 
-    def _get_account_info(self) -> Optional[AccountInfo]:
+    async def _get_account_info(self) -> Optional[AccountInfo]:
         """Extract account info from the current page."""
         try:
-            import re
-            page_text = self.page.inner_text('body')
+            page_text = "\n".join(await self.page.locator(_ACCOUNT_REGIONS).all_inner_texts())
+            account_match = _ACCOUNT_RE.search(page_text)
+            addr_match = _ADDR_RE.search(page_text)
+
+            # Only read the whole body if the summary regions didn't have everything
+            if not (account_match and addr_match):
+                body_text = await self.page.inner_text('body')
+                account_match = account_match or _ACCOUNT_RE.search(body_text)
+                addr_match = addr_match or _ADDR_RE.search(body_text)
 
             # Extract account number
-            account_match = re.search(r'(\d{4}\s+\d{2}\s+\d{3}\s+\d{7})', page_text)
             account_number = account_match.group(1) if account_match else "UNKNOWN"
 
             # Extract service address - look for address patterns
-            addr_match = re.search(r'(\d+\s+[A-Z][A-Z0-9\s]+(?:WAY|CT|ST|AVE|DR|RD|LN|BLVD|PL|CIR))\s*[,\s]+([A-Z]+)[,\s]+([A-Z]{2})\s+(\d{5})', page_text, re.IGNORECASE)
             if addr_match:
                 service_address = f"{addr_match.group(1).strip()}, {addr_match.group(2).strip()}, {addr_match.group(3).strip()} {addr_match.group(4)}"
             else:
@@ -509,67 +808,164 @@ class XfinityScraper:
             print(f"Error getting account info: {e}")
             return None
 
-    def fetch_bills(self, headless: bool = True) -> FetchResult:
+    def _store_pdf(self, pdf_path: str, bill_data: InternetBillData) -> InternetBillData:
+        """Copy a parsed statement to standard storage and point bill_data at the copy.
+
+        The copy is skipped when standard storage already holds the file.
+        """
+        # Copy to standardized location
+        billing_date = bill_data.billing_period_end or bill_data.bill_date or datetime.now().date()
+        if isinstance(billing_date, str):
+            billing_date = datetime.strptime(billing_date, "%Y-%m-%d").date()
+        billing_datetime = datetime.combine(billing_date, datetime.min.time()) if hasattr(billing_date, 'year') else datetime.now()
+        std_path = self._copy_to_standard_location(pdf_path, bill_data.service_address, billing_datetime)
+        bill_data.pdf_path = std_path
+        return bill_data
+
+    @staticmethod
+    async def _bounded(step, name: str, timeout: float):
+        """Await one scraping stage, turning a stall into _StageTimeout."""
+        try:
+            return await asyncio.wait_for(step, timeout=timeout)
+        except (asyncio.TimeoutError, _pw_timeout()) as e:
+            raise _StageTimeout(f"{name} timed out: {str(e) or f'no result after {timeout}s'}") from e
+
+    async def _fetch(self) -> FetchResult:
+        """Log in and download the latest statement using the current page."""
+        result = FetchResult(success=False)
+
+        try:
+            # Login
+            if not await self._bounded(self._login(), "Login", self.LOGIN_TIMEOUT):
+                result.errors.append("Login failed")
+                return result
+            await self._save_session()
+
+            # Get account info
+            account_info = await self._get_account_info()
+            if account_info:
+                result.accounts.append(account_info)
+
+            # Navigate to billing
+            await self._bounded(self._navigate_to_billing(), "Billing navigation", self.NAVIGATION_TIMEOUT)
+
+            # Download statement PDF
+            pdf_path = await self._bounded(self._download_statement_pdf(), "PDF download", self.DOWNLOAD_TIMEOUT)
+        except _StageTimeout as e:
+            result.errors.append(str(e))
+            return result
+
+        if pdf_path:
+            result.downloaded_pdfs.append(pdf_path)
+
+        result.success = len(result.bills) > 0 or len(result.downloaded_pdfs) > 0
+        return result
+
+    async def fetch_bills_async(
+        self, pool: Optional[XfinityBrowserPool] = None, headless: bool = True
+    ) -> FetchResult:
         """
         Main method to fetch bills from the portal.
 
         Args:
-            headless: Run browser in headless mode
+            pool: Shared browser to open this account's context on; when
+                omitted a browser is launched (and closed) just for this call
+            headless: Run browser in headless mode (only used without a pool)
 
         Returns:
             FetchResult with accounts, bills, and any errors
         """
+        if pool is None:
+            async with XfinityBrowserPool(headless=headless) as pool:
+                return await self.fetch_bills_async(pool)
+
+        if self.account_id:
+            print(f"\n{'='*60}")
+            print(f"Processing account: {self.account_id}")
+            print(f"{'='*60}")
+
         result = FetchResult(success=False)
+        try:
+            await self._setup_browser(pool)
+            result = await self._fetch()
 
-        with sync_playwright() as playwright:
+        except Exception as e:
+            result.errors.append(f"Scraper error: {str(e)}")
+            import traceback
+            traceback.print_exc()
+
+        finally:
+            if self.context:
+                await self.context.close()
+            if self._http:
+                self._http.close()
+
+        # Parsing needs no browser, so it runs after the context is released and
+        # in a worker process, leaving the event loop free for other accounts
+        for pdf_path in result.downloaded_pdfs:
             try:
-                self._setup_browser(playwright, headless=headless)
-
-                # Login
-                if not self._login():
-                    result.errors.append("Login failed")
-                    return result
-
-                # Get account info
-                account_info = self._get_account_info()
-                if account_info:
-                    result.accounts.append(account_info)
-
-                # Navigate to billing
-                self._navigate_to_billing()
-
-                # Download statement PDF
-                pdf_path = self._download_statement_pdf()
-                if pdf_path:
-                    result.downloaded_pdfs.append(pdf_path)
-
-                    # Parse the PDF
-                    try:
-                        bill_data = parse_pdf(pdf_path)
-                        # Copy to standardized location
-                        billing_date = bill_data.billing_period_end or bill_data.bill_date or datetime.now().date()
-                        if isinstance(billing_date, str):
-                            billing_date = datetime.strptime(billing_date, "%Y-%m-%d").date()
-                        billing_datetime = datetime.combine(billing_date, datetime.min.time()) if hasattr(billing_date, 'year') else datetime.now()
-                        std_path = self._copy_to_standard_location(pdf_path, bill_data.service_address, billing_datetime)
-                        bill_data.pdf_path = std_path
-                        result.bills.append(bill_data)
-                    except Exception as e:
-                        result.errors.append(f"Error parsing PDF {pdf_path}: {e}")
-
-                result.success = len(result.bills) > 0 or len(result.downloaded_pdfs) > 0
-
+                bill_data = await _parse_memoized(pdf_path, self.PARSE_TIMEOUT)
+                result.bills.append(await asyncio.to_thread(self._store_pdf, pdf_path, bill_data))
+            except asyncio.TimeoutError:
+                result.errors.append(f"Timed out parsing PDF {pdf_path} after {self.PARSE_TIMEOUT}s")
             except Exception as e:
-                result.errors.append(f"Scraper error: {str(e)}")
-                import traceback
-                traceback.print_exc()
-
-            finally:
-                if self.browser:
-                    self.browser.close()
+                result.errors.append(f"Error parsing PDF {pdf_path}: {e}")
 
         return result
 
+    def fetch_bills(self, headless: bool = True) -> FetchResult:
+        """Synchronous wrapper around fetch_bills_async."""
+        return asyncio.run(self.fetch_bills_async(headless=headless))
+
+    @classmethod
+    async def fetch_bills_multi_async(
+        cls,
+        accounts: list[tuple[str, str, str]],
+        download_dir: str,
+        headless: bool = True,
+        concurrent: bool = True,
+    ) -> list[tuple[str, FetchResult]]:
+        """
+        Fetch bills for several accounts, launching Chromium only once.
+
+        Each account gets its own browser context, so cookies and sessions stay
+        isolated while the browser launch cost is paid a single time. With
+        concurrent=True the accounts run interleaved on the event loop, so one
+        account's page loads overlap another's.
+
+        Args:
+            accounts: (account_id, username, password) tuples
+            download_dir: Directory for downloaded PDFs
+            headless: Run browser in headless mode
+            concurrent: Scrape accounts concurrently instead of one at a time
+
+        Returns:
+            (account_id, FetchResult) pairs in input order
+        """
+        scrapers = [cls(username, password, download_dir, account_id=account_id)
+                    for account_id, username, password in accounts]
+
+        async with XfinityBrowserPool(headless=headless) as pool:
+            if concurrent:
+                results = await asyncio.gather(*(s.fetch_bills_async(pool) for s in scrapers))
+            else:
+                results = [await s.fetch_bills_async(pool) for s in scrapers]
+
+        return [(s.account_id, r) for s, r in zip(scrapers, results)]
+
+    @classmethod
+    def fetch_bills_multi(
+        cls,
+        accounts: list[tuple[str, str, str]],
+        download_dir: str,
+        headless: bool = True,
+        concurrent: bool = True,
+    ) -> list[tuple[str, FetchResult]]:
+        """Synchronous wrapper around fetch_bills_multi_async."""
+        return asyncio.run(cls.fetch_bills_multi_async(
+            accounts, download_dir, headless=headless, concurrent=concurrent
+        ))
+
 
 def main():
     """Main entry point for the scraper."""
@@ -583,8 +979,8 @@ def main():
         load_dotenv(env_local, override=True)
 
     # Try different env var patterns
-    username = os.getenv("XFINITY_INTERENT_USER") or os.getenv("XFINITY_INTERNET_USER") or os.getenv("XFINITY_USER")
-    password = os.getenv("XFINITY_INTERENT_PASS") or os.getenv("XFINITY_INTERNET_PASS") or os.getenv("XFINITY_PASS")
+    username = first_env("XFINITY_INTERENT_USER", "XFINITY_INTERNET_USER", "XFINITY_USER")
+    password = first_env("XFINITY_INTERENT_PASS", "XFINITY_INTERNET_PASS", "XFINITY_PASS")
 
     if not username or not password:
         print("Error: Xfinity credentials not found. Set one of:")
@@ -641,19 +1037,24 @@ def main():
                 print(f"*** ATTENTION REQUIRED: {bill.attention_reason} ***")
 
     # Save results to JSON
-    output_path = download_dir / f"fetch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    now = datetime.now()
+    output_path = download_dir / f"fetch_results_{now.strftime('%Y%m%d_%H%M%S')}.json"
     download_dir.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w') as f:
-        json.dump({
-            "success": result.success,
-            "timestamp": datetime.now().isoformat(),
-            "accounts": [{"account_number": a.account_number, "service_address": a.service_address, "balance": a.current_balance} for a in result.accounts],
-            "bills": [b.to_dict() for b in result.bills],
-            "errors": result.errors,
-            "downloaded_pdfs": result.downloaded_pdfs,
-        }, f, indent=2)
+    payload = {
+        "success": result.success,
+        "timestamp": now.isoformat(),
+        "accounts": [{"account_number": a.account_number, "service_address": a.service_address, "balance": a.current_balance} for a in result.accounts],
+        "bills": [b.to_dict() for b in result.bills],
+        "errors": result.errors,
+        "downloaded_pdfs": result.downloaded_pdfs,
+    }
+    output_path.write_bytes(_dumps(payload, indent=True))
     print(f"\nResults saved to: {output_path}")
 
+    # Run history: one compact line appended per run, never rewritten
+    with open(download_dir / "fetch_results.ndjson", "ab") as f:
+        f.write(_dumps(payload) + b"\n")
+
 
 if __name__ == "__main__":
     main()